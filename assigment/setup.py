@@ -2,18 +2,34 @@
 Setup script for Rudderstack SDET Assignment Framework
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 import os
+import sys
+
+# Package list is spelled out instead of scanned with find_packages();
+# add new packages here
+PACKAGES = [
+    "src",
+    "src.pages",
+    "src.tests",
+    "src.utils",
+]
+
+# Commands that publish long_description; egg_info, develop, --version etc. don't
+README_COMMANDS = {"sdist", "bdist", "bdist_wheel", "upload"}
 
 # Read the README file
 def read_readme():
+    if not README_COMMANDS.intersection(sys.argv[1:]):
+        return ""
     with open("README.md", "r", encoding="utf-8") as fh:
         return fh.read()
 
 # Read requirements
 def read_requirements():
     with open("requirements.txt", "r", encoding="utf-8") as fh:
-        return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+        # Strip each line once, drop blanks and comments
+        return [req for req in (line.strip() for line in fh) if req and req[0] != "#"]
 
 setup(
     name="rudderstack-sdet-framework",
@@ -24,7 +40,7 @@ setup(
     long_description=read_readme(),
     long_description_content_type="text/markdown",
     url="https://github.com/your-username/rudderstack-sdet-assignment",
-    packages=find_packages(),
+    packages=PACKAGES,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -7,14 +7,32 @@ __version__ = "1.0.0"
 __author__ = "SDET Candidate"
 __email__ = "candidate@example.com"
 
-from .utils.config_manager import config_manager
-from .utils.api_client import api_client
-from .utils.test_data import test_data_generator, test_scenario_manager, test_data_validator
-
 __all__ = [
     'config_manager',
     'api_client', 
     'test_data_generator',
     'test_scenario_manager',
     'test_data_validator'
-] 
\ No newline at end of file
+]
+
+# Attribute name -> submodule providing it. Resolved on first access (PEP 562)
+# so importing the package does not pull in requests/dotenv/Faker up front.
+_LAZY_ATTRIBUTES = {
+    'config_manager': '.utils.config_manager',
+    'api_client': '.utils.api_client',
+    'test_data_generator': '.utils.test_data',
+    'test_scenario_manager': '.utils.test_data',
+    'test_data_validator': '.utils.test_data',
+}
+
+
+def __getattr__(name):
+    """Import framework singletons on first access and cache them on the package"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
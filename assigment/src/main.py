@@ -3,18 +3,58 @@ Main entry point for Rudderstack SDET Assignment Framework
 Provides command-line interface for running tests and managing the framework.
 """
 
+import os
 import sys
+import logging
 import argparse
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from loguru import logger
 
-from utils.config_manager import config_manager
-from utils.test_data import test_scenario_manager
+# Replaced by loguru's logger in configure_logging() when RUDDERSTACK_USE_LOGURU=1
+logger = logging.getLogger('rudderstack')
 
+SUBCOMMANDS = ('run-tests', 'validate-config', 'list-scenarios', 'setup')
 
-def main():
-    """Main entry point for the framework"""
+
+def build_run_tests_parser(subparsers):
+    """Register the run-tests subcommand"""
+    run_parser = subparsers.add_parser('run-tests', help='Run test scenarios')
+    run_parser.add_argument('--smoke', action='store_true', help='Run smoke tests only')
+    run_parser.add_argument('--integration', action='store_true', help='Run integration tests only')
+    run_parser.add_argument('--regression', action='store_true', help='Run regression tests only')
+    run_parser.add_argument('--env', choices=['dev', 'qa', 'prod'], default='dev', help='Environment to test against')
+    run_parser.add_argument('--headless', action='store_true', help='Run tests in headless mode')
+    run_parser.add_argument('--browser', choices=['chrome', 'firefox', 'safari'], default='chrome', help='Browser to use')
+    run_parser.add_argument('--parallel', action='store_true', help='Run tests in parallel')
+    run_parser.add_argument('--scenario', help='Run specific test scenario')
+
+
+def build_validate_config_parser(subparsers):
+    """Register the validate-config subcommand"""
+    subparsers.add_parser('validate-config', help='Validate framework configuration')
+
+
+def build_list_scenarios_parser(subparsers):
+    """Register the list-scenarios subcommand"""
+    subparsers.add_parser('list-scenarios', help='List available test scenarios')
+
+
+def build_setup_parser(subparsers):
+    """Register the setup subcommand"""
+    subparsers.add_parser('setup', help='Setup the framework')
+
+
+SUBPARSER_BUILDERS = {
+    'run-tests': build_run_tests_parser,
+    'validate-config': build_validate_config_parser,
+    'list-scenarios': build_list_scenarios_parser,
+    'setup': build_setup_parser,
+}
+
+
+def build_parser(commands=SUBCOMMANDS) -> argparse.ArgumentParser:
+    """Build the CLI parser with only the requested subcommands registered"""
     parser = argparse.ArgumentParser(
         description="Rudderstack SDET Assignment Framework",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -31,26 +71,36 @@ Examples:
     )
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    for command in commands:
+        SUBPARSER_BUILDERS[command](subparsers)
     
-    # Run tests command
-    run_parser = subparsers.add_parser('run-tests', help='Run test scenarios')
-    run_parser.add_argument('--smoke', action='store_true', help='Run smoke tests only')
-    run_parser.add_argument('--integration', action='store_true', help='Run integration tests only')
-    run_parser.add_argument('--regression', action='store_true', help='Run regression tests only')
-    run_parser.add_argument('--env', choices=['dev', 'qa', 'prod'], default='dev', help='Environment to test against')
-    run_parser.add_argument('--headless', action='store_true', help='Run tests in headless mode')
-    run_parser.add_argument('--browser', choices=['chrome', 'firefox', 'safari'], default='chrome', help='Browser to use')
-    run_parser.add_argument('--parallel', action='store_true', help='Run tests in parallel')
-    run_parser.add_argument('--scenario', help='Run specific test scenario')
-    
-    # Validate config command
-    subparsers.add_parser('validate-config', help='Validate framework configuration')
-    
-    # List scenarios command
-    subparsers.add_parser('list-scenarios', help='List available test scenarios')
+    return parser
+
+
+def configure_logging():
+    """Set up CLI logging: stdlib logging by default, loguru when RUDDERSTACK_USE_LOGURU=1"""
+    global logger
+    if os.environ.get('RUDDERSTACK_USE_LOGURU') == '1':
+        from loguru import logger
+    else:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s | %(levelname)s | %(message)s",
+            datefmt="%H:%M:%S"
+        )
+
+
+def main():
+    """Main entry point for the framework"""
+    configure_logging()
     
-    # Setup command
-    subparsers.add_parser('setup', help='Setup the framework')
+    # Only build the subparser that will actually run; --help, no command and
+    # unknown commands get the full parser so usage and errors are unchanged
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command in SUBPARSER_BUILDERS:
+        parser = build_parser((command,))
+    else:
+        parser = build_parser()
     
     # Parse arguments
     args = parser.parse_args()
@@ -60,14 +110,7 @@ Examples:
         return
     
     # Execute command
-    if args.command == 'run-tests':
-        run_tests(args)
-    elif args.command == 'validate-config':
-        validate_config()
-    elif args.command == 'list-scenarios':
-        list_scenarios()
-    elif args.command == 'setup':
-        setup_framework()
+    return COMMAND_HANDLERS[args.command](args)
 
 
 def run_tests(args):
@@ -122,6 +165,8 @@ def run_tests(args):
 
 def validate_config():
     """Validate framework configuration"""
+    from utils.config_manager import config_manager
+    
     logger.info("Validating framework configuration...")
     
     try:
@@ -171,6 +216,8 @@ def validate_config():
 
 def list_scenarios():
     """List available test scenarios"""
+    from utils.test_data import test_scenario_manager
+    
     logger.info("Available test scenarios:")
     
     scenarios = test_scenario_manager.get_all_scenarios()
@@ -204,15 +251,33 @@ def setup_framework():
             else:
                 logger.warning("env.example not found, please create .env file manually")
         
-        # Install dependencies
-        logger.info("Installing Python dependencies...")
-        subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'], check=True)
-        
-        logger.info("Installing Node.js dependencies...")
-        subprocess.run(['npm', 'install'], check=True)
+        # Install dependencies. The Python and Node.js installs are independent and
+        # run side by side; Playwright browsers need the Node.js packages first.
+        install_steps = {
+            'Python dependencies': [
+                [sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'],
+            ],
+            'Node.js dependencies and Playwright browsers': [
+                ['npm', 'install'],
+                ['npx', 'playwright', 'install', '--with-deps'],
+            ],
+        }
         
-        logger.info("Installing Playwright browsers...")
-        subprocess.run(['npx', 'playwright', 'install', '--with-deps'], check=True)
+        with ThreadPoolExecutor(max_workers=len(install_steps)) as executor:
+            futures = {}
+            for step, commands in install_steps.items():
+                logger.info(f"Installing {step}...")
+                futures[executor.submit(_run_commands, commands)] = step
+            
+            for future in as_completed(futures):
+                try:
+                    results = future.result()
+                except subprocess.CalledProcessError as e:
+                    _log_process_output(e)
+                    raise
+                for result in results:
+                    _log_process_output(result)
+                logger.info(f"Installed {futures[future]}")
         
         logger.info("✓ Framework setup completed successfully")
         
@@ -223,5 +288,26 @@ def setup_framework():
     return 0
 
 
+# Subcommand -> handler taking the parsed args; handlers import their own dependencies
+COMMAND_HANDLERS = {
+    'run-tests': run_tests,
+    'validate-config': lambda args: validate_config(),
+    'list-scenarios': lambda args: list_scenarios(),
+    'setup': lambda args: setup_framework(),
+}
+
+
+def _run_commands(commands):
+    """Run commands in order with captured output, stopping at the first failure"""
+    return [subprocess.run(cmd, check=True, capture_output=True, text=True) for cmd in commands]
+
+
+def _log_process_output(process):
+    """Log captured output of a finished (or failed) subprocess"""
+    for output in (process.stdout, process.stderr):
+        if output:
+            logger.info(output.rstrip())
+
+
 if __name__ == "__main__":
     sys.exit(main()) 
\ No newline at end of file
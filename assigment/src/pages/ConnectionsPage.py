@@ -3,20 +3,20 @@ Connections Page Object for Rudderstack Application
 Handles connections page interactions and data extraction.
 """
 
-import time
 import re
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from loguru import logger
 
 from .LoginPage import BasePage
 from ..utils.config_manager import config_manager
 
+_URL_RE = re.compile(r'https?://[^\s<>"\']+')
+
 
 class ConnectionsPage(BasePage):
     """
@@ -42,49 +42,74 @@ class ConnectionsPage(BasePage):
     SEARCH_INPUT = (By.CSS_SELECTOR, "input[placeholder*='search'], input[type='search'], .search-input")
     FILTER_DROPDOWN = (By.CSS_SELECTOR, ".filter-dropdown, .filter-select, select")
     
+    _CONNECTIONS_PATH = "/connections"
+    
+    # Source types that accept events over the HTTP API
+    HTTP_SOURCE_TYPES = frozenset(('http', 'webhook', 'api'))
+    
+    # Any of these means the connections page has rendered; checked as one CSS union
+    _LOAD_INDICATORS = (
+        SOURCES_SECTION[1],
+        DESTINATIONS_SECTION[1],
+        ".connections-page",
+        "[data-testid='connections-page']"
+    )
+    _LOADED = (By.CSS_SELECTOR, ", ".join(_LOAD_INDICATORS))
+    
+    # Tried in priority order, so probed as a batch rather than a union
+    DATA_PLANE_URL_SELECTORS = (
+        DATA_PLANE_URL[1],
+        ".endpoint, .api-endpoint",
+        "[data-testid='data-plane']",
+        ".url-display, .endpoint-url",
+        "code, .code-block"
+    )
+    _DATA_PLANE_URL_LOCATORS = {selector: (By.CSS_SELECTOR, selector) for selector in DATA_PLANE_URL_SELECTORS}
+    DATA_PLANE_TEXT = (By.XPATH, "//*[contains(text(), 'dataplane') or contains(text(), 'endpoint')]")
+    
     def __init__(self, driver: WebDriver):
         """Initialize connections page"""
         super().__init__(driver)
-        self.connections_url = f"{self.base_url}/connections"
+        
+        # Lookups over the most recent get_sources() result
+        self._sources_by_name: Dict[str, Dict[str, Any]] = {}
+        self._http_sources: List[Dict[str, Any]] = []
+        
+        # (dom key, sources) from the last successful scan
+        self._sources_cache: Optional[Tuple[Tuple[str, int], List[Dict[str, Any]]]] = None
+    
+    @property
+    def connections_url(self) -> str:
+        """Full URL of the connections page"""
+        return f"{self.base_url}{self._CONNECTIONS_PATH}"
     
     def is_page_loaded(self) -> bool:
         """Check if connections page is loaded"""
         try:
             # Check for multiple possible indicators
-            indicators = [
-                self.SOURCES_SECTION,
-                self.DESTINATIONS_SECTION,
-                (By.CSS_SELECTOR, ".connections-page"),
-                (By.CSS_SELECTOR, "[data-testid='connections-page']")
-            ]
-            
-            for indicator in indicators:
-                if self.is_element_present(indicator, timeout=5):
-                    return True
-            
-            return False
+            return self.is_element_present(self._LOADED)
         except Exception:
             return False
     
     def navigate_to_connections(self) -> None:
         """Navigate to connections page"""
         try:
-            # Try direct navigation first
+            # Try direct navigation first, giving the client-rendered page time to appear
             self.navigate_to(self.connections_url)
+            loaded = self.is_element_present(self._LOADED, timeout=10, wait=True)
             
             # If that doesn't work, try clicking the connections link
-            if not self.is_page_loaded():
-                if self.is_element_present(self.CONNECTIONS_LINK, timeout=5):
-                    self.safe_click(self.CONNECTIONS_LINK)
-                    time.sleep(2)
+            if not loaded and self.is_element_present(self.CONNECTIONS_LINK, timeout=5, wait=True):
+                self.safe_click(self.CONNECTIONS_LINK)
+                loaded = self.is_element_present(self._LOADED, timeout=10, wait=True)
             
-            if not self.is_page_loaded():
+            if not loaded:
                 raise Exception("Connections page failed to load")
                 
             logger.info("Successfully navigated to connections page")
             
         except Exception as e:
-            logger.error(f"Failed to navigate to connections page: {str(e)}")
+            logger.error("Failed to navigate to connections page: {}", e)
             raise
     
     def get_data_plane_url(self) -> Optional[str]:
@@ -96,98 +121,82 @@ class ConnectionsPage(BasePage):
         """
         try:
             # Try multiple possible selectors for data plane URL
-            data_plane_selectors = [
-                self.DATA_PLANE_URL,
-                (By.CSS_SELECTOR, ".endpoint, .api-endpoint"),
-                (By.CSS_SELECTOR, "[data-testid='data-plane']"),
-                (By.CSS_SELECTOR, ".url-display, .endpoint-url"),
-                (By.CSS_SELECTOR, "code, .code-block"),
-                (By.XPATH, "//*[contains(text(), 'dataplane') or contains(text(), 'endpoint')]")
-            ]
-            
-            for selector in data_plane_selectors:
-                if self.is_element_present(selector, timeout=3):
-                    url_text = self.get_element_text(selector)
-                    
-                    # Extract URL using regex
-                    url_pattern = r'https?://[^\s<>"\']+'
-                    match = re.search(url_pattern, url_text)
-                    
-                    if match:
-                        data_plane_url = match.group(0)
-                        logger.info(f"Extracted data plane URL: {data_plane_url}")
-                        return data_plane_url
+            candidates = [self._DATA_PLANE_URL_LOCATORS[selector] for selector in self._present_selectors(self.DATA_PLANE_URL_SELECTORS)]
+            
+            # XPath can't go through querySelector, so it is only probed when the CSS batch misses
+            if not candidates and self.is_element_present(self.DATA_PLANE_TEXT):
+                candidates.append(self.DATA_PLANE_TEXT)
+            
+            for selector in candidates:
+                url_text = self.get_element_text(selector, timeout=3)
+                
+                # Extract URL using regex
+                match = _URL_RE.search(url_text)
+                
+                if match:
+                    data_plane_url = match.group(0)
+                    logger.info(f"Extracted data plane URL: {data_plane_url}")
+                    return data_plane_url
             
             logger.warning("Data plane URL not found on page")
             return None
             
         except Exception as e:
-            logger.error(f"Failed to extract data plane URL: {str(e)}")
+            logger.error("Failed to extract data plane URL: {}", e)
             return None
     
-    def get_sources(self) -> List[Dict[str, Any]]:
+    def _invalidate_cache(self) -> None:
+        """Forget the cached sources scan"""
+        self._sources_cache = None
+    
+    def get_sources(self, cached: bool = True) -> List[Dict[str, Any]]:
         """
         Get all sources from the connections page
         
+        Args:
+            cached: Reuse the previous scan while the page URL and DOM size are unchanged
+            
         Returns:
             List of source information dictionaries
         """
         sources = []
         
         try:
-            # Wait for sources section to load
-            if not self.is_element_present(self.SOURCES_SECTION, timeout=10):
+            # Reuse the last scan while the page is unchanged, otherwise wait for sources section to load
+            dom_key = self._dom_key()
+            if cached and self._sources_cache is not None and self._sources_cache[0] == dom_key:
+                sources = self._sources_cache[1]
+            elif not self.is_element_present(self.SOURCES_SECTION, timeout=10, wait=True):
                 logger.warning("Sources section not found")
-                return sources
-            
-            # Find all source items
-            source_elements = self.driver.find_elements(*self.SOURCE_ITEM)
-            
-            for source_element in source_elements:
-                try:
-                    source_info = self._extract_source_info(source_element)
-                    if source_info:
-                        sources.append(source_info)
-                except Exception as e:
-                    logger.warning(f"Failed to extract source info: {str(e)}")
-                    continue
-            
-            logger.info(f"Found {len(sources)} sources")
-            return sources
+            else:
+                # Key the scan on the rendered page, so the next call on an unchanged page hits
+                dom_key = self._dom_key()
+                
+                # Read every source card in one round trip; cards without a name or type are skipped
+                items = self._extract_items(self.SOURCE_ITEM[1], {
+                    'name': self.SOURCE_NAME[1],
+                    'type': self.SOURCE_TYPE[1],
+                    'write_key': self.WRITE_KEY[1]
+                })
+                sources = [item for item in items if item['name'] is not None and item['type'] is not None]
+                self._sources_cache = (dom_key, sources)
+                
+                logger.info(f"Found {len(sources)} sources")
             
         except Exception as e:
-            logger.error(f"Failed to get sources: {str(e)}")
-            return sources
+            logger.error("Failed to get sources: {}", e)
+        
+        self._index_sources(sources)
+        return sources
     
-    def _extract_source_info(self, source_element: WebElement) -> Optional[Dict[str, Any]]:
-        """Extract information from a source element"""
-        try:
-            # Extract source name
-            name_element = source_element.find_element(*self.SOURCE_NAME)
-            name = name_element.text.strip()
-            
-            # Extract source type
-            type_element = source_element.find_element(*self.SOURCE_TYPE)
-            source_type = type_element.text.strip()
-            
-            # Extract write key if available
-            write_key = None
-            try:
-                write_key_element = source_element.find_element(*self.WRITE_KEY)
-                write_key = write_key_element.text.strip()
-            except NoSuchElementException:
-                pass
-            
-            return {
-                'name': name,
-                'type': source_type,
-                'write_key': write_key,
-                'element': source_element
-            }
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract source info: {str(e)}")
-            return None
+    def _index_sources(self, sources: List[Dict[str, Any]]) -> None:
+        """Rebuild the by-name and HTTP-only lookups; the first source wins on duplicate names"""
+        sources_by_name = {}
+        for source in sources:
+            sources_by_name.setdefault(source['name'].lower(), source)
+        
+        self._sources_by_name = sources_by_name
+        self._http_sources = [source for source in sources if source['type'].lower() in self.HTTP_SOURCE_TYPES]
     
     def get_http_source_write_key(self, source_name: Optional[str] = None) -> Optional[str]:
         """
@@ -200,50 +209,56 @@ class ConnectionsPage(BasePage):
             Write key if found, None otherwise
         """
         try:
-            sources = self.get_sources()
+            self.get_sources()
             
-            for source in sources:
-                # Check if it's an HTTP source
-                if source['type'].lower() in ['http', 'webhook', 'api']:
-                    # If source name is specified, check for exact match
-                    if source_name and source['name'].lower() != source_name.lower():
-                        continue
-                    
-                    if source['write_key']:
-                        logger.info(f"Found HTTP source write key: {source['write_key']}")
-                        return source['write_key']
+            if source_name:
+                # A named source must itself be an HTTP source
+                source = self._sources_by_name.get(source_name.lower())
+                http_sources = [source] if source is not None and source['type'].lower() in self.HTTP_SOURCE_TYPES else []
+            else:
+                http_sources = self._http_sources
+            
+            for source in http_sources:
+                if source['write_key']:
+                    logger.info(f"Found HTTP source write key: {source['write_key']}")
+                    return source['write_key']
             
             logger.warning("HTTP source write key not found")
             return None
             
         except Exception as e:
-            logger.error(f"Failed to get HTTP source write key: {str(e)}")
+            logger.error("Failed to get HTTP source write key: {}", e)
             return None
     
-    def click_source(self, source_name: str) -> bool:
+    def click_source(self, source_name: str, sources: Optional[List[Dict[str, Any]]] = None) -> bool:
         """
         Click on a specific source
         
         Args:
             source_name: Name of the source to click
+            sources: Previously fetched sources to reuse (optional)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            sources = self.get_sources()
-            
-            for source in sources:
-                if source['name'].lower() == source_name.lower():
-                    source['element'].click()
-                    logger.info(f"Clicked on source: {source_name}")
-                    return True
+            if sources is None:
+                self.get_sources()
+            else:
+                self._index_sources(sources)
+            
+            source = self._sources_by_name.get(source_name.lower())
+            if source is not None:
+                self._invalidate_cache()
+                source['element'].click()
+                logger.info(f"Clicked on source: {source_name}")
+                return True
             
             logger.warning(f"Source '{source_name}' not found")
             return False
             
         except Exception as e:
-            logger.error(f"Failed to click source '{source_name}': {str(e)}")
+            logger.error("Failed to click source '{}': {}", source_name, e)
             return False
     
     def get_destinations(self) -> List[Dict[str, Any]]:
@@ -257,49 +272,37 @@ class ConnectionsPage(BasePage):
         
         try:
             # Wait for destinations section to load
-            if not self.is_element_present(self.DESTINATIONS_SECTION, timeout=10):
+            if not self.is_element_present(self.DESTINATIONS_SECTION, timeout=10, wait=True):
                 logger.warning("Destinations section not found")
                 return destinations
             
-            # Find all destination items
-            destination_elements = self.driver.find_elements(*self.DESTINATION_ITEM)
-            
-            for destination_element in destination_elements:
-                try:
-                    destination_info = self._extract_destination_info(destination_element)
-                    if destination_info:
-                        destinations.append(destination_info)
-                except Exception as e:
-                    logger.warning(f"Failed to extract destination info: {str(e)}")
-                    continue
+            # Read every destination card in one round trip; cards without a name or type are skipped
+            items = self._extract_items(self.DESTINATION_ITEM[1], {
+                'name': self.DESTINATION_NAME[1],
+                'type': self.DESTINATION_TYPE[1]
+            })
+            destinations = [item for item in items if item['name'] is not None and item['type'] is not None]
             
             logger.info(f"Found {len(destinations)} destinations")
             return destinations
             
         except Exception as e:
-            logger.error(f"Failed to get destinations: {str(e)}")
+            logger.error("Failed to get destinations: {}", e)
             return destinations
     
-    def _extract_destination_info(self, destination_element: WebElement) -> Optional[Dict[str, Any]]:
-        """Extract information from a destination element"""
-        try:
-            # Extract destination name
-            name_element = destination_element.find_element(*self.DESTINATION_NAME)
-            name = name_element.text.strip()
-            
-            # Extract destination type
-            type_element = destination_element.find_element(*self.DESTINATION_TYPE)
-            destination_type = type_element.text.strip()
-            
-            return {
-                'name': name,
-                'type': destination_type,
-                'element': destination_element
-            }
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract destination info: {str(e)}")
-            return None
+    def get_connections(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get sources and destinations together, reading both lists concurrently
+        
+        Returns:
+            Dictionary with 'sources' and 'destinations' lists
+        """
+        # get_sources refreshes this page's source cache and lookups, so it goes first to stay on this thread
+        sources, destinations = self._read_concurrently(self.get_sources, self.get_destinations)
+        return {
+            'sources': sources,
+            'destinations': destinations
+        }
     
     def click_webhook_destination(self, destination_name: Optional[str] = None) -> bool:
         """
@@ -329,7 +332,7 @@ class ConnectionsPage(BasePage):
             return False
             
         except Exception as e:
-            logger.error(f"Failed to click webhook destination: {str(e)}")
+            logger.error("Failed to click webhook destination: {}", e)
             return False
     
     def search_sources(self, search_term: str) -> List[Dict[str, Any]]:
@@ -343,14 +346,18 @@ class ConnectionsPage(BasePage):
             List of matching sources
         """
         try:
-            if self.is_element_present(self.SEARCH_INPUT, timeout=5):
+            if self.is_element_present(self.SEARCH_INPUT):
+                previous_results = self.driver.find_elements(*self.SOURCE_ITEM)[:1]
                 self.safe_type(self.SEARCH_INPUT, search_term)
-                time.sleep(2)  # Wait for search results
+                
+                # Wait for the result list to re-render, capped at the old fixed delay
+                if previous_results:
+                    self._wait_until(EC.staleness_of(previous_results[0]), timeout=2)
             
             return self.get_sources()
             
         except Exception as e:
-            logger.error(f"Failed to search sources: {str(e)}")
+            logger.error("Failed to search sources: {}", e)
             return []
     
     def filter_by_type(self, filter_type: str) -> List[Dict[str, Any]]:
@@ -364,15 +371,15 @@ class ConnectionsPage(BasePage):
             List of filtered sources
         """
         try:
-            if self.is_element_present(self.FILTER_DROPDOWN, timeout=5):
-                # Implementation would depend on the specific filter dropdown structure
+            if self.is_element_present(self.FILTER_DROPDOWN, timeout=5, wait=True):
+                # Implementation would depend on the specific filter dropdown structure;
+                # nothing is applied yet, so there is no re-render to wait for
                 logger.info(f"Filtering sources by type: {filter_type}")
-                time.sleep(2)  # Wait for filter to apply
             
             return self.get_sources()
             
         except Exception as e:
-            logger.error(f"Failed to filter sources: {str(e)}")
+            logger.error("Failed to filter sources: {}", e)
             return []
     
     def copy_write_key(self, source_name: str) -> Optional[str]:
@@ -386,22 +393,27 @@ class ConnectionsPage(BasePage):
             Copied write key if successful, None otherwise
         """
         try:
+            # Scan the sources once and reuse the result for both the click and the key
+            sources = self.get_sources()
+            source = self._sources_by_name.get(source_name.lower())
+            
             # First click on the source to open details
-            if not self.click_source(source_name):
+            if source is None or not self.click_source(source_name, sources):
+                logger.warning(f"Source '{source_name}' not found")
                 return None
             
             # Look for copy button
-            if self.is_element_present(self.COPY_BUTTON, timeout=5):
+            if self.is_element_present(self.COPY_BUTTON, timeout=5, wait=True):
                 self.safe_click(self.COPY_BUTTON)
                 logger.info(f"Copied write key for source: {source_name}")
                 
                 # In a real implementation, you might need to get the clipboard content
                 # For now, we'll return the write key we already extracted
-                return self.get_http_source_write_key(source_name)
+                return source['write_key']
             
             logger.warning(f"Copy button not found for source: {source_name}")
             return None
             
         except Exception as e:
-            logger.error(f"Failed to copy write key for source '{source_name}': {str(e)}")
+            logger.error("Failed to copy write key for source '{}': {}", source_name, e)
             return None 
\ No newline at end of file
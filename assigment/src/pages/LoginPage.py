@@ -3,23 +3,67 @@ Login Page Object for Rudderstack Application
 Follows Page Object Model pattern and SOLID principles.
 """
 
+import atexit
+import json
+import os
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from io import BytesIO
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 from abc import ABC, abstractmethod
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from loguru import logger
 
 from ..utils.config_manager import config_manager
 
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; screenshots fall back to the driver's PNG
+    Image = None
+
+# Reads the text of each field selector inside every item matching itemSelector
+_EXTRACT_ITEMS_JS = """
+(itemSelector, fields, includeElement) => Array.from(document.querySelectorAll(itemSelector), el => {
+    const item = includeElement ? {element: el} : {};
+    for (const [key, selector] of Object.entries(fields)) {
+        const child = el.querySelector(selector);
+        item[key] = child ? child.innerText.trim() : null;
+    }
+    return item;
+})
+"""
+
+# Upper bound on concurrent read-only commands sent over driver sessions
+MAX_READ_WORKERS = 8
+
+# Shared by every page; worker threads only start on first use
+_READ_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_READ_WORKERS, thread_name_prefix="page-read")
+atexit.register(_READ_EXECUTOR.shutdown)
+
 
 class BasePage(ABC):
     """Abstract base page class following Template Method Pattern"""
     
+    # Poll interval for is_element_present(wait=True); real waits keep the 0.5s default
+    PROBE_POLL_FREQUENCY = 0.1
+    
+    # Failures a retry can fix; anything else (missing element, bad selector, timeout) is raised at once
+    TRANSIENT_EXCEPTIONS = (StaleElementReferenceException, ElementClickInterceptedException)
+    
+    # Environment URL shared by every page, keyed on the settings it was read from
+    _base_url: Optional[str] = None
+    _base_url_settings = None
+    
     def __init__(self, driver: WebDriver):
         """
         Initialize base page
@@ -28,40 +72,80 @@ class BasePage(ABC):
             driver: WebDriver instance
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, config_manager.browser_config.timeout)
-        self.base_url = config_manager.get_environment_url()
+        
+        # Bind the settings read on every wait/click once per page
+        self._default_timeout = config_manager.browser_config.timeout
+        self._max_retries = config_manager.api_config.max_retries
+        self._retry_delay = config_manager.api_config.retry_delay
+        
+        self.wait = WebDriverWait(driver, self._default_timeout)
+        self._waits = {(self._default_timeout, None): self.wait}
+        self.base_url = self._get_base_url()
+    
+    @staticmethod
+    def _get_base_url() -> str:
+        """Return the environment URL, re-reading it only after the settings change"""
+        if BasePage._base_url_settings is not config_manager.settings:
+            BasePage._base_url = config_manager.get_environment_url()
+            BasePage._base_url_settings = config_manager.settings
+        return BasePage._base_url
     
     @abstractmethod
     def is_page_loaded(self) -> bool:
         """Check if page is loaded"""
         pass
     
+    def _invalidate_cache(self) -> None:
+        """Drop cached DOM reads after an action that may change the page; no-op unless a page caches"""
+        pass
+    
+    def _dom_key(self) -> Tuple[str, int]:
+        """Cheap fingerprint of the current page: URL plus serialized DOM length, in one round trip"""
+        url, length = self.driver.execute_script(
+            "return [location.href, document.documentElement.outerHTML.length]"
+        )
+        return url, length
+    
     def navigate_to(self, url: str) -> None:
         """Navigate to specific URL"""
+        self._invalidate_cache()
         try:
             self.driver.get(url)
             logger.info(f"Navigated to: {url}")
         except Exception as e:
-            logger.error(f"Failed to navigate to {url}: {str(e)}")
+            logger.error("Failed to navigate to {}: {}", url, e)
             raise
     
+    def _get_wait(self, timeout: Optional[int] = None, poll_frequency: Optional[float] = None) -> WebDriverWait:
+        """Return a shared WebDriverWait for the timeout and poll interval, creating it on first use"""
+        if timeout is None and poll_frequency is None:
+            return self.wait
+        
+        key = (timeout or self._default_timeout, poll_frequency)
+        wait = self._waits.get(key)
+        if wait is None:
+            if poll_frequency is None:
+                wait = WebDriverWait(self.driver, key[0])
+            else:
+                wait = WebDriverWait(self.driver, key[0], poll_frequency=poll_frequency)
+            self._waits[key] = wait
+        return wait
+    
     def wait_for_element(self, locator: tuple, timeout: Optional[int] = None) -> WebElement:
         """Wait for element to be present and visible"""
-        wait_time = timeout or config_manager.browser_config.timeout
-        wait = WebDriverWait(self.driver, wait_time)
+        wait_time = timeout or self._default_timeout
+        wait = self._get_wait(wait_time)
         
         try:
-            element = wait.until(EC.presence_of_element_located(locator))
-            wait.until(EC.visibility_of(element))
-            return element
+            return wait.until(EC.visibility_of_element_located(locator))
         except TimeoutException:
             logger.error(f"Element not found within {wait_time} seconds: {locator}")
             raise
     
     def wait_for_element_clickable(self, locator: tuple, timeout: Optional[int] = None) -> WebElement:
         """Wait for element to be clickable"""
-        wait_time = timeout or config_manager.browser_config.timeout
-        wait = WebDriverWait(self.driver, wait_time)
+        wait_time = timeout or self._default_timeout
+        wait = self._get_wait(wait_time)
         
         try:
             return wait.until(EC.element_to_be_clickable(locator))
@@ -71,33 +155,41 @@ class BasePage(ABC):
     
     def safe_click(self, locator: tuple, timeout: Optional[int] = None) -> None:
         """Safely click on element with retry mechanism"""
-        max_retries = config_manager.api_config.max_retries
-        
-        for attempt in range(max_retries):
+        self._invalidate_cache()
+        for attempt in range(self._max_retries):
             try:
                 element = self.wait_for_element_clickable(locator, timeout)
                 element.click()
                 logger.info(f"Successfully clicked element: {locator}")
                 return
-            except Exception as e:
-                logger.warning(f"Click attempt {attempt + 1} failed: {str(e)}")
-                if attempt == max_retries - 1:
+            except self.TRANSIENT_EXCEPTIONS as e:
+                logger.warning("Click attempt {} failed: {}", attempt + 1, e)
+                if attempt == self._max_retries - 1:
                     raise
-                time.sleep(config_manager.api_config.retry_delay)
+                time.sleep(self._retry_delay)
     
     def safe_type(self, locator: tuple, text: str, clear_first: bool = True, timeout: Optional[int] = None) -> None:
-        """Safely type text into element"""
-        try:
-            element = self.wait_for_element(locator, timeout)
-            
-            if clear_first:
-                element.clear()
-            
-            element.send_keys(text)
-            logger.info(f"Successfully typed text into element: {locator}")
-        except Exception as e:
-            logger.error(f"Failed to type text into element {locator}: {str(e)}")
-            raise
+        """Safely type text into element with retry mechanism"""
+        self._invalidate_cache()
+        for attempt in range(self._max_retries):
+            try:
+                element = self.wait_for_element(locator, timeout)
+                
+                if clear_first:
+                    element.clear()
+                
+                element.send_keys(text)
+                logger.info(f"Successfully typed text into element: {locator}")
+                return
+            except self.TRANSIENT_EXCEPTIONS as e:
+                logger.warning("Type attempt {} failed: {}", attempt + 1, e)
+                if attempt == self._max_retries - 1:
+                    logger.error("Failed to type text into element {}: {}", locator, e)
+                    raise
+                time.sleep(self._retry_delay)
+            except Exception as e:
+                logger.error("Failed to type text into element {}: {}", locator, e)
+                raise
     
     def get_element_text(self, locator: tuple, timeout: Optional[int] = None) -> str:
         """Get text from element"""
@@ -107,24 +199,212 @@ class BasePage(ABC):
             logger.info(f"Retrieved text from element {locator}: {text}")
             return text
         except Exception as e:
-            logger.error(f"Failed to get text from element {locator}: {str(e)}")
+            logger.error("Failed to get text from element {}: {}", locator, e)
             raise
     
-    def is_element_present(self, locator: tuple, timeout: int = 5) -> bool:
-        """Check if element is present on page"""
+    def _wait_until(self, condition, timeout: Optional[int] = None, poll_frequency: Optional[float] = None) -> bool:
+        """
+        Wait for an expected condition without raising on timeout
+        
+        Args:
+            condition: Expected condition to wait for
+            timeout: Maximum time to wait in seconds (defaults to the browser timeout)
+            poll_frequency: Seconds between checks (defaults to WebDriverWait's 0.5)
+            
+        Returns:
+            True if the condition was met, False if the wait timed out
+        """
         try:
-            self.wait_for_element(locator, timeout)
+            self._get_wait(timeout, poll_frequency).until(condition)
             return True
         except TimeoutException:
             return False
     
+    def _poll_with_backoff(self, predicate: Callable[[], bool], timeout: float,
+                           initial_delay: float = 0.1, max_delay: float = 1.0) -> bool:
+        """
+        Poll a cheap predicate until it holds, doubling the delay after each miss
+        
+        Args:
+            predicate: Zero-argument check to evaluate
+            timeout: Maximum time to poll in seconds
+            initial_delay: Delay after the first miss in seconds
+            max_delay: Cap on the delay between checks in seconds
+            
+        Returns:
+            True if the predicate held within timeout, False otherwise
+        """
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        
+        while True:
+            if predicate():
+                return True
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+    
+    def is_element_present(self, locator: tuple, timeout: int = 5, wait: bool = False) -> bool:
+        """
+        Check if element is present on page
+        
+        By default this is a single find_elements probe that returns at once
+        when the element is absent. Pass wait=True to poll every PROBE_POLL_FREQUENCY
+        seconds, for up to timeout seconds, until the element is visible.
+        
+        Args:
+            locator: Element locator
+            timeout: Maximum time to wait in seconds (only used with wait=True)
+            wait: Wait for the element instead of probing once
+            
+        Returns:
+            True if element is present, False otherwise
+        """
+        if not wait:
+            return len(self.driver.find_elements(*locator)) > 0
+        
+        try:
+            self._get_wait(timeout, self.PROBE_POLL_FREQUENCY).until(EC.visibility_of_element_located(locator))
+            return True
+        except TimeoutException:
+            return False
+    
+    def _any_present(self, css_selectors: Sequence[str]) -> int:
+        """
+        Probe several CSS selectors in a single script round trip
+        
+        Only a selector whose first match is rendered counts, since callers go on to
+        read or click that element and would otherwise wait out its visibility.
+        
+        Args:
+            css_selectors: CSS selectors in priority order
+            
+        Returns:
+            Index of the first selector whose first match is visible, -1 if none is
+        """
+        return self.driver.execute_script(
+            "return arguments[0].findIndex(s => {"
+            " const el = document.querySelector(s);"
+            " return el !== null && el.getClientRects().length > 0; })",
+            css_selectors
+        )
+    
+    def _present_selectors(self, css_selectors: Sequence[str]) -> Iterator[str]:
+        """Yield the visible CSS selectors in order, one round trip per match"""
+        start = 0
+        while start < len(css_selectors):
+            index = self._any_present(css_selectors[start:])
+            if index < 0:
+                return
+            start += index
+            yield css_selectors[start]
+            start += 1
+    
+    def _extract_items(self, item_selector: str, fields: Dict[str, str], include_element: bool = True) -> List[Dict[str, Any]]:
+        """
+        Read text fields from every matching item in a single script round trip
+        
+        Args:
+            item_selector: CSS selector for the item containers
+            fields: Mapping of result key to CSS selector within each item
+            include_element: Also return the item itself under 'element'
+            
+        Returns:
+            One dict per item with the field texts (None when a field is missing)
+        """
+        if include_element:
+            return self.driver.execute_script(f"return ({_EXTRACT_ITEMS_JS})(...arguments)", item_selector, fields, True)
+        return self._evaluate_by_value(_EXTRACT_ITEMS_JS, item_selector, fields, False)
+    
+    @cached_property
+    def _supports_cdp(self) -> bool:
+        """Whether the driver can run Chrome DevTools Protocol commands (Chromium only)"""
+        return hasattr(self.driver, 'execute_cdp_cmd')
+    
+    def _evaluate_by_value(self, function: str, *args: Any) -> Any:
+        """
+        Call a JS function with JSON-serializable arguments and return its value
+        
+        On Chromium drivers this uses CDP Runtime.evaluate with returnByValue,
+        which skips WebDriver's argument and element (de)serialization. Other
+        drivers, or a script error, fall back to execute_script.
+        """
+        if self._supports_cdp:
+            response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": f"({function})(...{json.dumps(args)})",
+                "returnByValue": True
+            })
+            if 'exceptionDetails' not in response:
+                return response['result'].get('value')
+            logger.debug("CDP evaluation failed, retrying with execute_script: {}", response['exceptionDetails'])
+        
+        return self.driver.execute_script(f"return ({function})(...arguments)", *args)
+    
+    def bulk_text(self, elements: List[WebElement], selector: str) -> List[str]:
+        """
+        Read the text of one child from each element in a single script round trip
+        
+        Args:
+            elements: Container elements to read from
+            selector: CSS selector of the child within each container
+            
+        Returns:
+            Trimmed text per element, '' where the child is missing
+        """
+        return self.driver.execute_script(
+            """
+            const [elements, selector] = arguments;
+            return elements.map(el => {
+                const child = el.querySelector(selector);
+                return child ? child.innerText.trim() : '';
+            });
+            """,
+            elements, selector
+        )
+    
+    def _read_concurrently(self, *reads: Callable[[], Any]) -> List[Any]:
+        """
+        Run independent read-only page queries concurrently
+        
+        The first read runs on the calling thread and may update page state;
+        the others run on the shared pool and must be non-mutating calls
+        (find_elements, execute_script reads). Clicks, typing and navigation
+        must stay on the calling thread.
+        
+        Args:
+            reads: Zero-argument callables to run
+            
+        Returns:
+            Results in the same order as the callables
+        """
+        if not reads:
+            return []
+        
+        futures = [_READ_EXECUTOR.submit(read) for read in reads[1:]]
+        return [reads[0]()] + [future.result() for future in futures]
+    
     def take_screenshot(self, filename: str) -> None:
-        """Take screenshot of current page"""
+        """
+        Take screenshot of current page
+        
+        Saved as a quality 75 JPEG (with a .jpg extension) when Pillow is
+        installed, otherwise as the PNG the driver returns.
+        """
         try:
-            self.driver.save_screenshot(f"screenshots/{filename}")
-            logger.info(f"Screenshot saved: {filename}")
+            path = f"screenshots/{filename}"
+            if Image is None:
+                self.driver.save_screenshot(path)
+            else:
+                path = f"{os.path.splitext(path)[0]}.jpg"
+                png = self.driver.get_screenshot_as_png()
+                Image.open(BytesIO(png)).convert('RGB').save(path, 'JPEG', quality=75, optimize=True)
+            logger.info(f"Screenshot saved: {path}")
         except Exception as e:
-            logger.error(f"Failed to take screenshot: {str(e)}")
+            logger.error("Failed to take screenshot: {}", e)
 
 
 class LoginPage(BasePage):
@@ -142,15 +422,35 @@ class LoginPage(BasePage):
     SUCCESS_MESSAGE = (By.CSS_SELECTOR, ".success-message, .alert-success")
     LOGIN_FORM = (By.CSS_SELECTOR, "form, .login-form")
     
-    def __init__(self, driver: WebDriver):
-        """Initialize login page"""
-        super().__init__(driver)
-        self.login_url = f"{self.base_url}/login"
+    _LOGIN_PATH = "/login"
+    
+    # Any of these means a session is active; checked as one CSS union
+    LOGGED_IN_INDICATORS = (
+        ".user-menu, .profile-menu, .account-menu",
+        "[data-testid='user-menu']",
+        ".dashboard, .home-page",
+        "[href*='logout']"
+    )
+    UNIFIED_LOGGED_IN = (By.CSS_SELECTOR, ", ".join(LOGGED_IN_INDICATORS))
+    
+    # Tried in priority order, so probed as a batch rather than a union
+    LOGOUT_SELECTORS = (
+        "[href*='logout']",
+        ".logout-btn",
+        "[data-testid='logout']",
+        "button[onclick*='logout']"
+    )
+    _LOGOUT_LOCATORS = {selector: (By.CSS_SELECTOR, selector) for selector in LOGOUT_SELECTORS}
+    
+    @property
+    def login_url(self) -> str:
+        """Full URL of the login page"""
+        return f"{self.base_url}{self._LOGIN_PATH}"
     
     def is_page_loaded(self) -> bool:
         """Check if login page is loaded"""
         try:
-            return self.is_element_present(self.LOGIN_FORM, timeout=10)
+            return self.is_element_present(self.LOGIN_FORM, timeout=10, wait=True)
         except Exception:
             return False
     
@@ -194,10 +494,14 @@ class LoginPage(BasePage):
             self.enter_password(password)
             
             # Submit login form
+            form_url = self.driver.current_url
             self.click_login_button()
             
             # Wait for navigation or error
-            time.sleep(2)
+            self._wait_until(EC.any_of(
+                EC.url_changes(form_url),
+                EC.presence_of_element_located(self.ERROR_MESSAGE)
+            ), timeout=10)
             
             # Check for success (redirected away from login page)
             if not self.is_page_loaded():
@@ -205,7 +509,7 @@ class LoginPage(BasePage):
                 return True
             
             # Check for error message
-            if self.is_element_present(self.ERROR_MESSAGE, timeout=5):
+            if self.is_element_present(self.ERROR_MESSAGE, timeout=5, wait=True):
                 error_text = self.get_element_text(self.ERROR_MESSAGE)
                 logger.error(f"Login failed with error: {error_text}")
                 return False
@@ -214,26 +518,26 @@ class LoginPage(BasePage):
             return False
             
         except Exception as e:
-            logger.error(f"Login process failed: {str(e)}")
+            logger.error("Login process failed: {}", e)
             self.take_screenshot(f"login_failure_{int(time.time())}.png")
             return False
     
     def get_error_message(self) -> Optional[str]:
         """Get error message if present"""
         try:
-            if self.is_element_present(self.ERROR_MESSAGE, timeout=5):
+            if self.is_element_present(self.ERROR_MESSAGE, timeout=5, wait=True):
                 return self.get_element_text(self.ERROR_MESSAGE)
         except Exception as e:
-            logger.error(f"Failed to get error message: {str(e)}")
+            logger.error("Failed to get error message: {}", e)
         return None
     
     def get_success_message(self) -> Optional[str]:
         """Get success message if present"""
         try:
-            if self.is_element_present(self.SUCCESS_MESSAGE, timeout=5):
+            if self.is_element_present(self.SUCCESS_MESSAGE, timeout=5, wait=True):
                 return self.get_element_text(self.SUCCESS_MESSAGE)
         except Exception as e:
-            logger.error(f"Failed to get success message: {str(e)}")
+            logger.error("Failed to get success message: {}", e)
         return None
     
     def click_forgot_password(self) -> None:
@@ -243,26 +547,15 @@ class LoginPage(BasePage):
     def is_logged_in(self) -> bool:
         """Check if user is logged in"""
         try:
-            # Check if we're still on login page
-            if self.is_page_loaded():
+            # Check if we're still on a visible login page; probe once so logged-in users don't pay the load timeout
+            if self._any_present((self.LOGIN_FORM[1],)) >= 0:
                 return False
             
             # Check for common logged-in indicators
-            logged_in_indicators = [
-                (By.CSS_SELECTOR, ".user-menu, .profile-menu, .account-menu"),
-                (By.CSS_SELECTOR, "[data-testid='user-menu']"),
-                (By.CSS_SELECTOR, ".dashboard, .home-page"),
-                (By.CSS_SELECTOR, "[href*='logout']")
-            ]
-            
-            for indicator in logged_in_indicators:
-                if self.is_element_present(indicator, timeout=3):
-                    return True
-            
-            return False
+            return self.is_element_present(self.UNIFIED_LOGGED_IN)
             
         except Exception as e:
-            logger.error(f"Failed to check login status: {str(e)}")
+            logger.error("Failed to check login status: {}", e)
             return False
     
     def logout(self) -> bool:
@@ -273,26 +566,19 @@ class LoginPage(BasePage):
                 return True
             
             # Look for logout elements
-            logout_selectors = [
-                (By.CSS_SELECTOR, "[href*='logout']"),
-                (By.CSS_SELECTOR, ".logout-btn"),
-                (By.CSS_SELECTOR, "[data-testid='logout']"),
-                (By.CSS_SELECTOR, "button[onclick*='logout']")
-            ]
-            
-            for selector in logout_selectors:
-                if self.is_element_present(selector, timeout=3):
-                    self.safe_click(selector)
-                    time.sleep(2)
-                    
-                    # Verify logout
-                    if not self.is_logged_in():
-                        logger.info("Logout successful")
-                        return True
+            for selector in self._present_selectors(self.LOGOUT_SELECTORS):
+                page_url = self.driver.current_url
+                self.safe_click(self._LOGOUT_LOCATORS[selector], timeout=3)
+                self._wait_until(EC.any_of(EC.url_contains('login'), EC.url_changes(page_url)), timeout=10)
+                
+                # Verify logout
+                if not self.is_logged_in():
+                    logger.info("Logout successful")
+                    return True
             
             logger.warning("Logout elements not found")
             return False
             
         except Exception as e:
-            logger.error(f"Logout failed: {str(e)}")
+            logger.error("Logout failed: {}", e)
             return False 
\ No newline at end of file
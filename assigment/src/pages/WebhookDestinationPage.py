@@ -4,18 +4,57 @@ Handles webhook destination page interactions and event verification.
 """
 
 import time
+import re
 from typing import Optional, Dict, Any, List
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from loguru import logger
 
 from .LoginPage import BasePage
 from ..utils.config_manager import config_manager
 
+_NUMBER_RE = re.compile(r'\d+')
+
+# Summary count texts plus the status of every rendered event row, in one round trip
+_COUNTS_SCRIPT = """
+const [deliveredSelector, failedSelector, totalSelector, itemSelector, statusSelector] = arguments;
+const read = selector => {
+    const el = document.querySelector(selector);
+    return el ? el.innerText : '';
+};
+const statuses = Array.from(document.querySelectorAll(itemSelector), el => {
+    const status = el.querySelector(statusSelector);
+    return status ? status.innerText.trim() : '';
+}).filter(Boolean);
+return [read(deliveredSelector), read(failedSelector), read(totalSelector), statuses];
+"""
+
+# Summary count texts plus the field texts of every event row that has a status,
+# optionally narrowed to rows whose status or payload contains a search term;
+# 'index' is the row's position among all rows
+_EVENTS_JS = """
+(countSelectors, itemSelector, fields, term) => {
+    const read = selector => {
+        const el = document.querySelector(selector);
+        return el ? el.innerText : '';
+    };
+    const events = Array.from(document.querySelectorAll(itemSelector), (el, index) => {
+        const item = {index};
+        for (const [key, selector] of Object.entries(fields)) {
+            const child = el.querySelector(selector);
+            item[key] = child ? child.innerText.trim() : null;
+        }
+        return item;
+    }).filter(e => e.status && (!term || e.status.includes(term) || (e.payload || '').includes(term)));
+    const [delivered, failed, total] = countSelectors.map(read);
+    return {delivered, failed, total, events};
+}
+"""
+
 
 class WebhookDestinationPage(BasePage):
     """
@@ -42,36 +81,86 @@ class WebhookDestinationPage(BasePage):
     NEXT_PAGE = (By.CSS_SELECTOR, ".next-page, .pagination-next")
     PREV_PAGE = (By.CSS_SELECTOR, ".prev-page, .pagination-prev")
     EVENTS_PER_PAGE = (By.CSS_SELECTOR, ".per-page, select[name='per_page']")
+    LOADING_INDICATOR = (By.CSS_SELECTOR, ".loading, .spinner")
+    
+    # Event statuses counted as a successful delivery
+    DELIVERED_STATUSES = frozenset(('delivered', 'success', '200'))
+    
+    # Any of these means the destination page has rendered; checked as one CSS union
+    _LOAD_INDICATORS = (
+        EVENTS_SECTION[1],
+        ".webhook-destination-page",
+        "[data-testid='webhook-destination']",
+        ".destination-details"
+    )
+    _LOADED = (By.CSS_SELECTOR, ", ".join(_LOAD_INDICATORS))
+    
+    # How long a get_events() result is reused, in seconds
+    EVENTS_CACHE_TTL = 0.5
+    
+    # Seconds between delivered-count reads in verify_event_delivery
+    DELIVERY_POLL_FREQUENCY = 0.2
     
     def __init__(self, driver: WebDriver):
         """Initialize webhook destination page"""
         super().__init__(driver)
+        
+        # Last unfiltered _event_snapshot() result and the monotonic time it was read
+        self._events_cache: Optional[Dict[str, Any]] = None
+        self._events_cache_ts = 0.0
+        
+        # Set once the events tab has been opened; cleared on navigation or refresh
+        self._on_events_tab = False
+        
+        # Rely on explicit waits only while this page is in use, so missing-element
+        # probes return at once instead of compounding with the implicit wait;
+        # close() puts the previous value back
+        self._prev_implicit_wait: Optional[float] = driver.timeouts.implicit_wait
+        driver.implicitly_wait(0)
+    
+    def close(self) -> None:
+        """Restore the driver's implicit wait"""
+        if self._prev_implicit_wait is not None:
+            self.driver.implicitly_wait(self._prev_implicit_wait)
+            self._prev_implicit_wait = None
+    
+    def navigate_to(self, url: str) -> None:
+        """Navigate to specific URL, leaving the events tab"""
+        self._on_events_tab = False
+        super().navigate_to(url)
+    
+    def __enter__(self) -> 'WebhookDestinationPage':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _invalidate_cache(self) -> None:
+        """Forget the cached events list"""
+        self._events_cache = None
     
     def is_page_loaded(self) -> bool:
         """Check if webhook destination page is loaded"""
         try:
-            # Check for multiple possible indicators
-            indicators = [
-                self.EVENTS_SECTION,
-                (By.CSS_SELECTOR, ".webhook-destination-page"),
-                (By.CSS_SELECTOR, "[data-testid='webhook-destination']"),
-                (By.CSS_SELECTOR, ".destination-details")
-            ]
-            
-            for indicator in indicators:
-                if self.is_element_present(indicator, timeout=5):
-                    return True
-            
-            return False
+            # One find_elements per poll for all indicators; returns on the first call when already loaded
+            return self._wait_until(lambda driver: driver.find_elements(*self._LOADED), timeout=5)
         except Exception:
             return False
     
+    def _wait_for_events_ready(self, timeout: int = 10) -> bool:
+        """Wait until no loading indicator is shown and the events section is present"""
+        return (
+            self._wait_until(EC.invisibility_of_element_located(self.LOADING_INDICATOR), timeout, 0.25)
+            and self._wait_until(EC.presence_of_element_located(self.EVENTS_SECTION), timeout, 0.25)
+        )
+    
     def click_events_tab(self) -> bool:
         """Click on events tab"""
         try:
-            if self.is_element_present(self.EVENTS_TAB, timeout=5):
+            if self.is_element_present(self.EVENTS_TAB, timeout=5, wait=True):
                 self.safe_click(self.EVENTS_TAB)
-                time.sleep(2)  # Wait for events to load
+                self._wait_for_events_ready()
+                self._on_events_tab = True
                 logger.info("Clicked on events tab")
                 return True
             
@@ -79,7 +168,7 @@ class WebhookDestinationPage(BasePage):
             return False
             
         except Exception as e:
-            logger.error(f"Failed to click events tab: {str(e)}")
+            logger.error("Failed to click events tab: {}", e)
             return False
     
     def get_event_counts(self) -> Dict[str, int]:
@@ -89,124 +178,144 @@ class WebhookDestinationPage(BasePage):
         Returns:
             Dictionary with delivered, failed, and total counts
         """
-        counts = {
-            'delivered': 0,
-            'failed': 0,
-            'total': 0
-        }
-        
         try:
-            # Try to get counts from summary elements
-            if self.is_element_present(self.DELIVERED_COUNT, timeout=5):
-                delivered_text = self.get_element_text(self.DELIVERED_COUNT)
-                counts['delivered'] = self._extract_number(delivered_text)
-            
-            if self.is_element_present(self.FAILED_COUNT, timeout=5):
-                failed_text = self.get_element_text(self.FAILED_COUNT)
-                counts['failed'] = self._extract_number(failed_text)
-            
-            if self.is_element_present(self.TOTAL_COUNT, timeout=5):
-                total_text = self.get_element_text(self.TOTAL_COUNT)
-                counts['total'] = self._extract_number(total_text)
-            
-            # If we couldn't get counts from summary, count from event list
-            if counts['total'] == 0:
-                events = self.get_events()
-                counts['total'] = len(events)
-                
-                for event in events:
-                    if event.get('status', '').lower() in ['delivered', 'success', '200']:
-                        counts['delivered'] += 1
-                    else:
-                        counts['failed'] += 1
+            snapshot = self._event_snapshot(cached=False)
+            counts = {key: snapshot[key] for key in ('delivered', 'failed', 'total')}
             
             logger.info(f"Event counts - Delivered: {counts['delivered']}, Failed: {counts['failed']}, Total: {counts['total']}")
             return counts
             
         except Exception as e:
-            logger.error(f"Failed to get event counts: {str(e)}")
-            return counts
+            logger.error("Failed to get event counts: {}", e)
+            return {
+                'delivered': 0,
+                'failed': 0,
+                'total': 0
+            }
     
-    def _extract_number(self, text: str) -> int:
-        """Extract number from text"""
-        try:
-            import re
-            numbers = re.findall(r'\d+', text)
-            return int(numbers[0]) if numbers else 0
-        except Exception:
-            return 0
+    def _count_from_dom(self) -> Dict[str, int]:
+        """
+        Read event counts from whatever is currently rendered, in a single round trip
+        
+        Unlike get_event_counts this never waits or switches tabs, so it is
+        cheap enough to evaluate on every poll of an explicit wait.
+        
+        Returns:
+            Dictionary with delivered, failed, and total counts
+        """
+        delivered_text, failed_text, total_text, statuses = self.driver.execute_script(
+            _COUNTS_SCRIPT,
+            self.DELIVERED_COUNT[1], self.FAILED_COUNT[1], self.TOTAL_COUNT[1],
+            self.EVENT_ITEM[1], self.EVENT_STATUS[1]
+        )
+        return self._tally(delivered_text, failed_text, total_text, statuses)
+    
+    def _tally(self, delivered_text: str, failed_text: str, total_text: str, statuses: List[str]) -> Dict[str, int]:
+        """Turn summary count texts into counts, counting row statuses when there is no summary"""
+        counts = {
+            'delivered': self._extract_number(delivered_text),
+            'failed': self._extract_number(failed_text),
+            'total': self._extract_number(total_text)
+        }
+        
+        # If there is no summary, count from the event rows
+        if counts['total'] == 0:
+            counts['total'] = len(statuses)
+            for status in statuses:
+                if status.lower() in self.DELIVERED_STATUSES:
+                    counts['delivered'] += 1
+                else:
+                    counts['failed'] += 1
+        
+        return counts
     
-    def get_events(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _extract_number(text: Optional[str]) -> int:
+        """Extract the first number from text, 0 if there is none"""
+        match = _NUMBER_RE.search(text) if text else None
+        return int(match.group()) if match else 0
+    
+    def _event_snapshot(self, cached: bool = True, search_term: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Read the event counts and event rows from the events tab in one round trip
+        
+        Args:
+            cached: Reuse a result read within the last EVENTS_CACHE_TTL seconds,
+                unless the page was acted on since
+            search_term: Only return events whose status or payload contains this
+                text; matched in the browser, and never cached
+            
+        Returns:
+            Dictionary with delivered, failed, and total counts and the list of events
+        """
+        if (not search_term and cached and self._events_cache is not None
+                and time.monotonic() - self._events_cache_ts < self.EVENTS_CACHE_TTL):
+            return self._events_cache
+        
+        snapshot = {'delivered': 0, 'failed': 0, 'total': 0, 'events': []}
+        
+        # Make sure we're on the events tab
+        if not self._on_events_tab and not self.click_events_tab():
+            return snapshot
+        
+        # Wait for events section to load
+        if not self.is_element_present(self.EVENTS_SECTION, timeout=10, wait=True):
+            logger.warning("Events section not found")
+            return snapshot
+        
+        # Rows without a status are skipped
+        data = self._evaluate_by_value(
+            _EVENTS_JS,
+            [self.DELIVERED_COUNT[1], self.FAILED_COUNT[1], self.TOTAL_COUNT[1]],
+            self.EVENT_ITEM[1],
+            {
+                'status': self.EVENT_STATUS[1],
+                'timestamp': self.EVENT_TIMESTAMP[1],
+                'payload': self.EVENT_PAYLOAD[1]
+            },
+            search_term or ''
+        )
+        events = data['events']
+        snapshot = self._tally(data['delivered'], data['failed'], data['total'], [e['status'] for e in events])
+        snapshot['events'] = events
+        logger.info(f"Found {len(events)} events")
+        
+        if not search_term:
+            self._events_cache = snapshot
+            self._events_cache_ts = time.monotonic()
+        return snapshot
+    
+    def get_events(self, cached: bool = True, search_term: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get all events from the events tab
         
+        Args:
+            cached: Reuse a result read within the last EVENTS_CACHE_TTL seconds,
+                unless the page was acted on since
+            search_term: Only return events whose status or payload contains this
+                text; matched in the browser, and never cached
+            
         Returns:
             List of event information dictionaries
         """
-        events = []
-        
         try:
-            # Make sure we're on the events tab
-            if not self.click_events_tab():
-                return events
-            
-            # Wait for events section to load
-            if not self.is_element_present(self.EVENTS_SECTION, timeout=10):
-                logger.warning("Events section not found")
-                return events
-            
-            # Find all event items
-            event_elements = self.driver.find_elements(*self.EVENT_ITEM)
-            
-            for event_element in event_elements:
-                try:
-                    event_info = self._extract_event_info(event_element)
-                    if event_info:
-                        events.append(event_info)
-                except Exception as e:
-                    logger.warning(f"Failed to extract event info: {str(e)}")
-                    continue
-            
-            logger.info(f"Found {len(events)} events")
-            return events
+            return self._event_snapshot(cached, search_term)['events']
             
         except Exception as e:
-            logger.error(f"Failed to get events: {str(e)}")
-            return events
+            logger.error("Failed to get events: {}", e)
+            return []
     
-    def _extract_event_info(self, event_element: WebElement) -> Optional[Dict[str, Any]]:
-        """Extract information from an event element"""
-        try:
-            # Extract event status
-            status_element = event_element.find_element(*self.EVENT_STATUS)
-            status = status_element.text.strip()
-            
-            # Extract timestamp
-            timestamp = None
-            try:
-                timestamp_element = event_element.find_element(*self.EVENT_TIMESTAMP)
-                timestamp = timestamp_element.text.strip()
-            except NoSuchElementException:
-                pass
-            
-            # Extract payload (if available)
-            payload = None
-            try:
-                payload_element = event_element.find_element(*self.EVENT_PAYLOAD)
-                payload = payload_element.text.strip()
-            except NoSuchElementException:
-                pass
-            
-            return {
-                'status': status,
-                'timestamp': timestamp,
-                'payload': payload,
-                'element': event_element
-            }
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract event info: {str(e)}")
-            return None
+    def get_event_elements(self) -> List[WebElement]:
+        """
+        Get live elements for the rendered event rows
+        
+        get_events() returns plain data; use an event's 'index' to pick its
+        element from this list when it has to be interacted with.
+        
+        Returns:
+            Event row elements in page order
+        """
+        return self.driver.find_elements(*self.EVENT_ITEM)
     
     def wait_for_event(self, timeout: int = 60) -> bool:
         """
@@ -222,41 +331,43 @@ class WebhookDestinationPage(BasePage):
             logger.info(f"Waiting for new event (timeout: {timeout}s)")
             
             initial_count = self.get_event_counts()['total']
-            start_time = time.time()
+            counts = {'total': initial_count}
             
-            while time.time() - start_time < timeout:
-                current_count = self.get_event_counts()['total']
-                
-                if current_count > initial_count:
-                    logger.info(f"New event detected! Count increased from {initial_count} to {current_count}")
-                    return True
-                
-                time.sleep(2)  # Check every 2 seconds
+            def count_increased() -> bool:
+                counts.update(self._count_from_dom())
+                return counts['total'] > initial_count
+            
+            if self._poll_with_backoff(count_increased, timeout):
+                logger.info(f"New event detected! Count increased from {initial_count} to {counts['total']}")
+                return True
             
             logger.warning(f"No new event appeared within {timeout} seconds")
             return False
             
         except Exception as e:
-            logger.error(f"Failed to wait for event: {str(e)}")
+            logger.error("Failed to wait for event: {}", e)
             return False
     
     def refresh_events(self) -> bool:
         """Refresh the events list"""
+        self._on_events_tab = False
         try:
-            if self.is_element_present(self.REFRESH_BUTTON, timeout=5):
+            if self.is_element_present(self.REFRESH_BUTTON, timeout=5, wait=True):
                 self.safe_click(self.REFRESH_BUTTON)
-                time.sleep(2)  # Wait for refresh
+                self._wait_for_events_ready()
                 logger.info("Refreshed events list")
                 return True
             
             # If no refresh button, try to reload the page
+            self._invalidate_cache()
             self.driver.refresh()
-            time.sleep(3)  # Wait for page to reload
+            self._wait_until(lambda driver: driver.execute_script("return document.readyState") == 'complete', 10, 0.25)
+            self._wait_for_events_ready()
             logger.info("Reloaded page to refresh events")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to refresh events: {str(e)}")
+            logger.error("Failed to refresh events: {}", e)
             return False
     
     def filter_events_by_status(self, status: str) -> List[Dict[str, Any]]:
@@ -270,15 +381,20 @@ class WebhookDestinationPage(BasePage):
             List of filtered events
         """
         try:
-            if self.is_element_present(self.STATUS_FILTER, timeout=5):
-                # Implementation would depend on the specific filter structure
-                logger.info(f"Filtering events by status: {status}")
-                time.sleep(2)  # Wait for filter to apply
+            # Without a filter control there is nothing to apply, so a fresh cached read will do
+            if not self.is_element_present(self.STATUS_FILTER):
+                logger.warning("Status filter not found")
+                return self.get_events(cached=True)
+            
+            # Implementation would depend on the specific filter structure
+            logger.info(f"Filtering events by status: {status}")
+            # Nothing is applied yet, so there is no re-render to wait for
+            self._invalidate_cache()
             
             return self.get_events()
             
         except Exception as e:
-            logger.error(f"Failed to filter events by status: {str(e)}")
+            logger.error("Failed to filter events by status: {}", e)
             return []
     
     def search_events(self, search_term: str) -> List[Dict[str, Any]]:
@@ -292,14 +408,19 @@ class WebhookDestinationPage(BasePage):
             List of matching events
         """
         try:
-            if self.is_element_present(self.SEARCH_EVENTS, timeout=5):
-                self.safe_type(self.SEARCH_EVENTS, search_term)
-                time.sleep(2)  # Wait for search results
+            # Without a search input, fall back to every event as before
+            if not self.is_element_present(self.SEARCH_EVENTS):
+                logger.warning("Search events input not found")
+                return self.get_events(cached=True)
             
-            return self.get_events()
+            self.safe_type(self.SEARCH_EVENTS, search_term)
+            self._wait_for_events_ready()
+            
+            # Match in the browser too, so only the hits cross the wire
+            return self.get_events(search_term=search_term)
             
         except Exception as e:
-            logger.error(f"Failed to search events: {str(e)}")
+            logger.error("Failed to search events: {}", e)
             return []
     
     def get_latest_event(self) -> Optional[Dict[str, Any]]:
@@ -322,7 +443,7 @@ class WebhookDestinationPage(BasePage):
             return latest_event
             
         except Exception as e:
-            logger.error(f"Failed to get latest event: {str(e)}")
+            logger.error("Failed to get latest event: {}", e)
             return None
     
     def verify_event_delivery(self, expected_count: int = 1, timeout: int = 60) -> bool:
@@ -339,22 +460,23 @@ class WebhookDestinationPage(BasePage):
         try:
             logger.info(f"Verifying event delivery (expected: {expected_count}, timeout: {timeout}s)")
             
-            start_time = time.time()
+            # The first read may need to open the events tab; later polls only read the DOM
+            counts = self.get_event_counts()
             
-            while time.time() - start_time < timeout:
-                counts = self.get_event_counts()
-                
-                if counts['delivered'] >= expected_count:
-                    logger.info(f"Event delivery verified! Delivered: {counts['delivered']}")
-                    return True
-                
-                time.sleep(2)  # Check every 2 seconds
+            def delivered_enough(_driver) -> bool:
+                counts.update(self._count_from_dom())
+                return counts['delivered'] >= expected_count
+            
+            # Poll at a fixed short interval so a delivery is seen within 0.2s of landing
+            if counts['delivered'] >= expected_count or self._wait_until(delivered_enough, timeout, self.DELIVERY_POLL_FREQUENCY):
+                logger.info(f"Event delivery verified! Delivered: {counts['delivered']}")
+                return True
             
             logger.warning(f"Event delivery verification failed. Expected: {expected_count}, Actual: {counts['delivered']}")
             return False
             
         except Exception as e:
-            logger.error(f"Failed to verify event delivery: {str(e)}")
+            logger.error("Failed to verify event delivery: {}", e)
             return False
     
     def get_delivery_stats(self) -> Dict[str, Any]:
@@ -365,8 +487,9 @@ class WebhookDestinationPage(BasePage):
             Dictionary with delivery statistics
         """
         try:
-            counts = self.get_event_counts()
-            events = self.get_events()
+            # Counts and events come from the same read
+            counts = self._event_snapshot(cached=False)
+            events = counts['events']
             
             # Calculate additional stats
             recent_events = [e for e in events if e.get('timestamp')]  # Events with timestamps
@@ -385,7 +508,7 @@ class WebhookDestinationPage(BasePage):
             return stats
             
         except Exception as e:
-            logger.error(f"Failed to get delivery stats: {str(e)}")
+            logger.error("Failed to get delivery stats: {}", e)
             return {
                 'total_events': 0,
                 'delivered_events': 0,
@@ -3,9 +3,14 @@ Pytest configuration file for Rudderstack test framework
 Contains shared fixtures and configuration for all tests.
 """
 
+import base64
+import functools
+from collections import Counter
 import pytest
 import os
+import shutil
 import sys
+import threading
 from pathlib import Path
 import time
 
@@ -18,18 +23,28 @@ from loguru import logger
 import logging
 
 # Remove default handler and add custom one
+# The file sink writes from loguru's background thread so tests (and xdist
+# workers) don't block on log I/O; CI keeps the console quiet and skips the
+# frame-walking exception diagnostics
+IN_CI = bool(os.environ.get("CI"))
+
 logger.remove()
 logger.add(
 	"logs/test_execution.log",
 	rotation="10 MB",
 	retention="7 days",
 	level="INFO",
-	format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}"
+	format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}",
+	enqueue=True,
+	backtrace=not IN_CI,
+	diagnose=not IN_CI
 )
 logger.add(
 	sys.stderr,
-	level="INFO",
-	format="{time:HH:mm:ss} | {level} | {message}"
+	level="WARNING" if IN_CI else "INFO",
+	format="{time:HH:mm:ss} | {level} | {message}",
+	backtrace=not IN_CI,
+	diagnose=not IN_CI
 )
 
 # Suppress urllib3 warnings
@@ -37,6 +52,134 @@ logging.getLogger("urllib3").setLevel(logging.WARNING)
 logging.getLogger("selenium").setLevel(logging.WARNING)
 
 
+def build_chrome_options():
+	"""Build Chrome options from the browser settings"""
+	from selenium.webdriver.chrome.options import Options
+	from utils.config_manager import config_manager
+	
+	# Configure Chrome options
+	chrome_options = Options()
+	
+	if config_manager.browser_config.headless:
+		chrome_options.add_argument("--headless")
+	
+	chrome_options.add_argument("--no-sandbox")
+	chrome_options.add_argument("--disable-dev-shm-usage")
+	chrome_options.add_argument("--disable-gpu")
+	chrome_options.add_argument("--window-size=1920,1080")
+	chrome_options.add_argument("--disable-web-security")
+	chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+	
+	# Tests only read text and click, so skip downloading and decoding images and loading extensions
+	chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+	chrome_options.add_argument("--disable-extensions")
+	chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+	
+	return chrome_options
+
+
+@functools.lru_cache(maxsize=None)
+def chromedriver_path():
+	"""
+	Resolve a local chromedriver once per process
+	
+	Returns CHROMEDRIVER_PATH, else a chromedriver on PATH, else None to let
+	Selenium Manager (bundled with Selenium) find a matching driver; it keeps
+	the binary in its on-disk cache, so only the first run downloads it.
+	"""
+	return os.environ.get("CHROMEDRIVER_PATH") or shutil.which("chromedriver")
+
+
+def create_driver(chrome_options=None):
+	"""Create a Chrome WebDriver configured from the browser settings"""
+	from selenium import webdriver
+	from selenium.webdriver.chrome.service import Service
+	from utils.config_manager import config_manager
+	
+	if chrome_options is None:
+		chrome_options = build_chrome_options()
+	
+	# Setup Chrome driver
+	service = Service(executable_path=chromedriver_path())
+	driver = webdriver.Chrome(service=service, options=chrome_options)
+	
+	# Configure timeouts; the implicit wait stays at 0 because page objects only use
+	# explicit waits and find_elements probes, which a nonzero implicit wait would
+	# stall on every missing-element poll
+	driver.set_page_load_timeout(config_manager.browser_config.page_load_timeout)
+	
+	return driver
+
+
+class DriverPool:
+	"""
+	Thread-local WebDriver pool
+	
+	Every thread gets its own browser, created on first use, so tests can run
+	concurrently without sharing a session. Under pytest-xdist each worker
+	process has its own pool. close_all() quits every driver the pool created.
+	"""
+	
+	def __init__(self, worker_id: str = "master", chrome_options=None):
+		self.worker_id = worker_id
+		self.chrome_options = chrome_options
+		self._local = threading.local()
+		self._drivers = []
+		self._lock = threading.Lock()
+	
+	def get(self):
+		"""Return the calling thread's driver, creating it on first use"""
+		driver = getattr(self._local, 'driver', None)
+		if driver is None:
+			try:
+				driver = create_driver(self.chrome_options)
+			except Exception as e:
+				logger.error(f"Failed to setup WebDriver: {str(e)}")
+				raise
+			
+			self._local.driver = driver
+			with self._lock:
+				self._drivers.append(driver)
+			logger.info(f"WebDriver setup completed ({self.worker_id}, {threading.current_thread().name})")
+		return driver
+	
+	def close_all(self):
+		"""Quit every driver created by the pool"""
+		with self._lock:
+			drivers, self._drivers = self._drivers, []
+		self._local = threading.local()
+		
+		for driver in drivers:
+			try:
+				driver.quit()
+				logger.info("WebDriver cleanup completed")
+			except Exception as e:
+				logger.error(f"Failed to cleanup WebDriver: {str(e)}")
+
+
+@pytest.fixture(scope="session")
+def browser_options():
+	"""Chrome options shared by every driver in the session"""
+	return build_chrome_options()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, browser_options):
+	"""Session-wide driver pool; one per pytest-xdist worker"""
+	worker_id = getattr(request.config, 'workerinput', {}).get('workerid', 'master')
+	pool = DriverPool(worker_id, browser_options)
+	
+	yield pool
+	
+	pool.close_all()
+
+
+@pytest.fixture(scope="session")
+def driver(driver_pool):
+	"""WebDriver shared by every test in the session (per pytest-xdist worker)"""
+	return driver_pool.get()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def apply_cli_overrides(pytestconfig):
 	"""Apply CLI overrides for environment, base URL, email, and password."""
@@ -79,6 +222,22 @@ def test_environment():
 	}
 
 
+@pytest.fixture(scope="session")
+def credentials(apply_cli_overrides):
+	"""Rudderstack credentials, read once after CLI overrides are applied"""
+	from utils.config_manager import config_manager
+	
+	return config_manager.get_credentials()
+
+
+@pytest.fixture(scope="session")
+def webhook_url(apply_cli_overrides):
+	"""Webhook URL, read once after CLI overrides are applied"""
+	from utils.config_manager import config_manager
+	
+	return config_manager.get_webhook_url()
+
+
 @pytest.fixture(scope="session")
 def test_data_manager():
 	"""Setup test data manager"""
@@ -116,19 +275,36 @@ def screenshot_on_failure(request):
 	"""Take screenshot on test failure"""
 	yield
 	
-	if request.node.rep_call.failed:
+	report = getattr(request.node, 'rep_call', None)
+	if report is not None and report.failed:
 		try:
-			from selenium import webdriver
 			driver = request.getfixturevalue('driver')
 			if driver:
+				os.makedirs("screenshots", exist_ok=True)
 				timestamp = int(time.time())
-				screenshot_path = f"screenshots/failure_{request.node.name}_{timestamp}.png"
-				driver.save_screenshot(screenshot_path)
+				
+				# On Chromium, have DevTools encode a JPEG instead of sending a full PNG over the WebDriver wire
+				if hasattr(driver, 'execute_cdp_cmd'):
+					screenshot_path = f"screenshots/failure_{request.node.name}_{timestamp}.jpg"
+					data = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "jpeg", "quality": 60})["data"]
+					with open(screenshot_path, "wb") as f:
+						f.write(base64.b64decode(data))
+				else:
+					screenshot_path = f"screenshots/failure_{request.node.name}_{timestamp}.png"
+					driver.save_screenshot(screenshot_path)
 				logger.info(f"Screenshot saved: {screenshot_path}")
 		except Exception as e:
 			logger.error(f"Failed to take screenshot: {str(e)}")
 
 
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+	"""Expose each phase's report on the test item (item.rep_setup, item.rep_call, ...)"""
+	outcome = yield
+	report = outcome.get_result()
+	setattr(item, f"rep_{report.when}", report)
+
+
 # Pytest hooks
 def pytest_runtest_setup(item):
 	"""Setup before each test"""
@@ -171,21 +347,54 @@ def pytest_configure(config):
 	config.addinivalue_line(
 		"markers", "regression: marks tests as regression tests"
 	)
+	
+	if config.getoption("--max-xpath-lookups") is not None:
+		_count_locator_strategies()
+
+
+# Locator strategy -> lookups made by this process (plus finished xdist workers on the
+# controller); only filled with --max-xpath-lookups
+LOCATOR_COUNTS = Counter()
+
+
+def _count_locator_strategies():
+	"""Wrap find_element(s) on drivers and elements to count lookups per locator strategy"""
+	from selenium.webdriver.remote.webdriver import WebDriver
+	from selenium.webdriver.remote.webelement import WebElement
+	
+	def counting(find):
+		@functools.wraps(find)
+		def wrapper(self, by="id", value=None):
+			LOCATOR_COUNTS[by] += 1
+			return find(self, by, value)
+		return wrapper
+	
+	for cls in (WebDriver, WebElement):
+		cls.find_element = counting(cls.find_element)
+		cls.find_elements = counting(cls.find_elements)
 
 
-def pytest_collection_modifyitems(config, items):
-	"""Modify test collection to add markers based on test names"""
-	for item in items:
-		# Add markers based on test names
-		if "basic_flow" in item.name:
-			item.add_marker(pytest.mark.smoke)
-			item.add_marker(pytest.mark.integration)
-		elif "event_tracking" in item.name:
-			item.add_marker(pytest.mark.regression)
-		elif "error_handling" in item.name:
-			item.add_marker(pytest.mark.regression)
-		elif "webhook" in item.name:
-			item.add_marker(pytest.mark.integration)
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+	"""Add an xdist worker's locator counts to the controller's totals"""
+	LOCATOR_COUNTS.update(getattr(node, 'workeroutput', {}).get('locator_counts', {}))
+
+
+def pytest_sessionfinish(session, exitstatus):
+	"""Report locator usage and fail the run when XPath lookups exceed --max-xpath-lookups"""
+	max_xpath = session.config.getoption("--max-xpath-lookups")
+	if max_xpath is None:
+		return
+	
+	# xdist workers hand their counts to the controller, which checks the combined total
+	if hasattr(session.config, 'workeroutput'):
+		session.config.workeroutput['locator_counts'] = dict(LOCATOR_COUNTS)
+		return
+	
+	logger.info(f"Locator lookups by strategy: {dict(LOCATOR_COUNTS)}")
+	if LOCATOR_COUNTS["xpath"] > max_xpath:
+		logger.error(f"{LOCATOR_COUNTS['xpath']} XPath lookups exceed the limit of {max_xpath}; prefer ID or CSS locators")
+		session.exitstatus = pytest.ExitCode.TESTS_FAILED
 
 
 # Environment-specific configurations
@@ -227,6 +436,13 @@ def pytest_addoption(parser):
 		default=None,
 		help="Override Rudderstack password"
 	)
+	parser.addoption(
+		"--max-xpath-lookups",
+		action="store",
+		type=int,
+		default=None,
+		help="Count locator strategies and fail the run if more XPath lookups are made"
+	)
 
 
 @pytest.fixture(scope="session")
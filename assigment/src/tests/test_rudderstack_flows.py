@@ -11,85 +11,135 @@ pytest src/tests/test_rudderstack_flows.py::test_rudderstack_basic_flow -v --env
 import pytest
 import time
 from typing import Dict, Any
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from loguru import logger
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 
 from ..pages.LoginPage import LoginPage
 from ..pages.ConnectionsPage import ConnectionsPage
 from ..pages.WebhookDestinationPage import WebhookDestinationPage
-from ..utils.config_manager import config_manager
 from ..utils.api_client import api_client, APIFactory
 from ..utils.test_data import test_data_generator, test_scenario_manager, test_data_validator
 
-@pytest.mark.RUN_UI_TESTS
-class TestRudderstackFlows:
+
+def wait_for_event_delivered(webhook_page: WebhookDestinationPage, baseline: int = 0, count: int = 1,
+                             timeout: float = 10, poll: float = 0.2) -> Dict[str, int]:
     """
-    Test class for Rudderstack flows
-    Implements comprehensive test scenarios with proper setup and teardown
+    Poll the webhook page until at least count events past baseline are delivered
+    
+    Args:
+        webhook_page: Webhook destination page showing the events tab
+        baseline: Delivered count before the events were sent
+        count: Number of new deliveries to wait for
+        timeout: Maximum time to wait in seconds
+        poll: Delay between reads in seconds
+        
+    Returns:
+        The last event counts read, whether or not the target was reached
     """
+    counts = {'delivered': 0, 'failed': 0, 'total': 0}
     
-    @pytest.fixture(scope="class")
-    def driver(self):
-        """Setup WebDriver for all tests"""
-        try:
-            # Configure Chrome options
-            chrome_options = Options()
-            
-            if config_manager.browser_config.headless:
-                chrome_options.add_argument("--headless")
-            
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-            
-            # Setup Chrome driver
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # Configure timeouts
-            driver.implicitly_wait(config_manager.browser_config.implicit_wait)
-            driver.set_page_load_timeout(config_manager.browser_config.page_load_timeout)
-            
-            logger.info("WebDriver setup completed")
-            yield driver
-            
-        except Exception as e:
-            logger.error(f"Failed to setup WebDriver: {str(e)}")
-            raise
-        finally:
-            try:
-                driver.quit()
-                logger.info("WebDriver cleanup completed")
-            except Exception as e:
-                logger.error(f"Failed to cleanup WebDriver: {str(e)}")
+    def delivered(_driver) -> bool:
+        counts.update(webhook_page.get_event_counts())
+        return counts['delivered'] >= baseline + count
     
-    @pytest.fixture(scope="class")
-    def login_page(self, driver):
-        """Setup login page object"""
-        return LoginPage(driver)
+    try:
+        WebDriverWait(webhook_page.driver, timeout, poll_frequency=poll).until(delivered)
+    except TimeoutException:
+        pass
+    return counts
+
+
+@pytest.fixture(scope="session")
+def login_page(driver):
+    """Setup login page object"""
+    return LoginPage(driver)
+
+
+@pytest.fixture(scope="session")
+def connections_page(driver):
+    """Setup connections page object"""
+    return ConnectionsPage(driver)
+
+
+@pytest.fixture(scope="session")
+def webhook_page(driver):
+    """Setup webhook destination page object"""
+    with WebhookDestinationPage(driver) as page:
+        yield page
+
+
+@pytest.fixture(scope="session")
+def logged_in_driver(driver, login_page, credentials):
+    """WebDriver with a Rudderstack session, logged in once for the whole session"""
+    assert login_page.login(credentials['email'], credentials['password']), "Login to Rudderstack failed"
+    return driver
+
+
+@pytest.fixture
+def logged_in(logged_in_driver, login_page, credentials):
+    """Logged-in WebDriver for one test; logs in again only if the session has expired"""
+    if not login_page.is_element_present(login_page.UNIFIED_LOGGED_IN, timeout=5, wait=True):
+        logger.info("Session expired, logging in again")
+        assert login_page.login(credentials['email'], credentials['password']), "Login to Rudderstack failed"
+    return logged_in_driver
+
+
+@pytest.fixture
+def logged_out(driver):
+    """WebDriver without a Rudderstack session, for tests that exercise login themselves"""
+    try:
+        # Cookies and storage can only be cleared for the page's own origin
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except Exception as e:
+        logger.warning(f"Failed to clear browser state: {e}")
+    return driver
+
+
+@pytest.fixture(scope="class")
+def setup_connection(logged_in_driver, connections_page, webhook_page):
+    """Data plane URL, write key and webhook destination URL, read once per test class"""
+    connections_page.navigate_to_connections()
+    data_plane_url = connections_page.get_data_plane_url()
+    write_key = connections_page.get_http_source_write_key()
+    assert data_plane_url and write_key, "Failed to get required configuration"
     
-    @pytest.fixture(scope="class")
-    def connections_page(self, driver):
-        """Setup connections page object"""
-        return ConnectionsPage(driver)
+    # Remember where the webhook destination lives so tests can go straight there
+    assert connections_page.click_webhook_destination(), "Failed to click webhook destination"
+    assert webhook_page.is_page_loaded(), "Webhook destination page failed to load"
     
-    @pytest.fixture(scope="class")
-    def webhook_page(self, driver):
-        """Setup webhook destination page object"""
-        return WebhookDestinationPage(driver)
+    return {
+        'data_plane_url': data_plane_url,
+        'write_key': write_key,
+        'destination_url': logged_in_driver.current_url
+    }
+
+
+@pytest.fixture(autouse=True)
+def clean_browser(webhook_page):
+    """Reset the shared browser after each test instead of relaunching it, keeping the session"""
+    yield
+    
+    # Going back through the page object also drops its events-tab state and cache
+    webhook_page.navigate_to(webhook_page.base_url)
+
+
+@pytest.mark.RUN_UI_TESTS
+class TestRudderstackFlows:
+    """
+    Test class for Rudderstack flows
+    Implements comprehensive test scenarios with proper setup and teardown
+    """
     
     @pytest.fixture(scope="class")
     def test_data(self):
         """Setup test data for all tests"""
         return test_scenario_manager.create_test_data_for_scenario('basic_flow')
     
-    def test_rudderstack_basic_flow(self, driver, login_page, connections_page, webhook_page, test_data):
+    @pytest.mark.smoke
+    @pytest.mark.integration
+    def test_rudderstack_basic_flow(self, logged_in, login_page, connections_page, webhook_page, test_data):
         """
         Test the complete basic Rudderstack flow
         
@@ -98,20 +148,14 @@ class TestRudderstackFlows:
         2. Navigate to connections page
         3. Extract data plane URL
         4. Extract HTTP source write key
-        5. Send API event to HTTP source
-        6. Navigate to webhook destination
+        5. Navigate to webhook destination and read the current delivery counts
+        6. Send API event to HTTP source
         7. Verify event delivery counts
         """
         logger.info("Starting basic Rudderstack flow test")
         
-        # Test data
-        credentials = config_manager.get_credentials()
-        webhook_url = config_manager.get_webhook_url()
-        
-        # Step 1: Login to Rudderstack application
+        # Step 1: Login to Rudderstack application (done once per session by the logged_in fixture)
         logger.info("Step 1: Logging in to Rudderstack application")
-        assert login_page.login(credentials['email'], credentials['password']), \
-            "Login to Rudderstack failed"
         
         # Verify login success
         assert login_page.is_logged_in(), "User is not logged in after login attempt"
@@ -137,8 +181,17 @@ class TestRudderstackFlows:
         assert len(write_key) > 0, "Write key is empty"
         logger.info(f"✓ Extracted write key: {write_key[:10]}...")
         
-        # Step 5: Send API event to HTTP source
-        logger.info("Step 5: Sending API event to HTTP source")
+        # Step 5: Navigate to webhook destination
+        logger.info("Step 5: Navigating to webhook destination")
+        assert connections_page.click_webhook_destination(), "Failed to click webhook destination"
+        assert webhook_page.is_page_loaded(), "Webhook destination page failed to load"
+        
+        # Deliveries already on the shared webhook must not count towards this event
+        baseline = webhook_page.get_event_counts()['delivered']
+        logger.info(f"✓ Successfully navigated to webhook destination ({baseline} events already delivered)")
+        
+        # Step 6: Send API event to HTTP source
+        logger.info("Step 6: Sending API event to HTTP source")
         
         # Create test event using EventBuilder
         event_builder = APIFactory.create_event_builder()
@@ -146,7 +199,7 @@ class TestRudderstackFlows:
             .set_event_name("test_event") \
             .set_user_id("test_user_123") \
             .add_property("test_property", "test_value") \
-            .add_property("timestamp", int(time.time())) \
+            .add_property("timestamp", time.time_ns() // 1_000_000_000) \
             .build()
         
         # Send event via API
@@ -154,24 +207,15 @@ class TestRudderstackFlows:
         assert api_response['success'], f"Failed to send event: {api_response.get('error', 'Unknown error')}"
         logger.info(f"✓ Event sent successfully. Status: {api_response['status_code']}")
         
-        # Step 6: Navigate to webhook destination
-        logger.info("Step 6: Navigating to webhook destination")
-        assert connections_page.click_webhook_destination(), "Failed to click webhook destination"
-        assert webhook_page.is_page_loaded(), "Webhook destination page failed to load"
-        logger.info("✓ Successfully navigated to webhook destination")
-        
         # Step 7: Verify event delivery counts
         logger.info("Step 7: Verifying event delivery counts")
         
-        # Wait for event to be processed
-        time.sleep(5)  # Give some time for event processing
-        
-        # Get event counts
-        event_counts = webhook_page.get_event_counts()
+        # Wait for event to be processed, returning as soon as it is delivered
+        event_counts = wait_for_event_delivered(webhook_page, baseline=baseline)
         assert event_counts['total'] > 0, "No events found in webhook destination"
         
         # Verify delivery
-        assert event_counts['delivered'] > 0, "No events were delivered successfully"
+        assert event_counts['delivered'] > baseline, "No events were delivered successfully"
         logger.info(f"✓ Event delivery verified - Delivered: {event_counts['delivered']}, Failed: {event_counts['failed']}")
         
         # Additional verification: Check delivery stats
@@ -181,54 +225,55 @@ class TestRudderstackFlows:
         
         logger.info("✓ Basic Rudderstack flow test completed successfully")
     
-    def test_event_tracking_scenario(self, driver, login_page, connections_page, webhook_page, test_data):
+    @pytest.mark.regression
+    @pytest.mark.slow
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    def test_event_tracking_scenario(self, logged_in, connections_page, webhook_page, test_data):
         """
         Test event tracking with multiple events and properties
         """
         logger.info("Starting event tracking scenario test")
         
-        # Login and setup
-        credentials = config_manager.get_credentials()
-        assert login_page.login(credentials['email'], credentials['password']), "Login failed"
-        
+        # Setup
         connections_page.navigate_to_connections()
         data_plane_url = connections_page.get_data_plane_url()
         write_key = connections_page.get_http_source_write_key()
         
         assert data_plane_url and write_key, "Failed to get required configuration"
         
-        # Send multiple test events
+        # Open the webhook events first so earlier deliveries are not counted
+        connections_page.click_webhook_destination()
+        webhook_page.click_events_tab()
+        baseline = webhook_page.get_event_counts()['delivered']
+        
+        # Send multiple test events in one batch request
         event_types = ['page_view', 'product_viewed', 'add_to_cart', 'purchase']
         sent_events = []
         
+        # One builder for all events; build(consume=True) hands over each event and starts afresh
+        event_builder = APIFactory.create_event_builder()
         for event_type in event_types:
-            event_builder = APIFactory.create_event_builder()
             test_event = event_builder \
                 .set_event_name(event_type) \
-                .set_user_id(f"test_user_{int(time.time())}") \
-                .add_properties(test_data_generator.generate_event(event_name=event_type).properties) \
-                .build()
-            
-            api_response = api_client.send_event(test_event, write_key, data_plane_url)
-            assert api_response['success'], f"Failed to send {event_type} event"
+                .set_user_id(f"test_user_{time.time_ns() // 1_000_000_000}") \
+                .add_properties(test_data_generator.generate_properties()) \
+                .build(consume=True)
             sent_events.append(test_event)
-            logger.info(f"✓ Sent {event_type} event")
         
-        # Navigate to webhook and verify delivery
-        connections_page.click_webhook_destination()
-        webhook_page.click_events_tab()
-        
-        # Wait for events to be processed
-        time.sleep(10)
+        api_response = api_client.send_events_batch(sent_events, write_key, data_plane_url)
+        assert api_response['success'], f"Failed to send events: {api_response.get('error', 'Unknown error')}"
+        logger.info(f"✓ Sent {len(sent_events)} events: {', '.join(event_types)}")
         
-        # Verify all events were delivered
-        event_counts = webhook_page.get_event_counts()
-        assert event_counts['delivered'] >= len(sent_events), \
-            f"Expected {len(sent_events)} delivered events, got {event_counts['delivered']}"
+        # Wait for events to be processed, then verify all of them were delivered
+        event_counts = wait_for_event_delivered(webhook_page, baseline=baseline, count=len(sent_events))
+        delivered = event_counts['delivered'] - baseline
+        assert delivered >= len(sent_events), \
+            f"Expected {len(sent_events)} delivered events, got {delivered}"
         
-        logger.info(f"✓ Event tracking test completed - {event_counts['delivered']} events delivered")
+        logger.info(f"✓ Event tracking test completed - {delivered} events delivered")
     
-    def test_error_handling_scenarios(self, driver, login_page, connections_page, webhook_page, test_data):
+    @pytest.mark.regression
+    def test_error_handling_scenarios(self, logged_out, login_page, connections_page, webhook_page, test_data, credentials):
         """
         Test error handling scenarios and edge cases
         """
@@ -240,7 +285,6 @@ class TestRudderstackFlows:
         assert not invalid_login_result, "Login should fail with invalid credentials"
         
         # Test with valid credentials
-        credentials = config_manager.get_credentials()
         assert login_page.login(credentials['email'], credentials['password']), "Valid login failed"
         
         # Test invalid write key
@@ -265,16 +309,15 @@ class TestRudderstackFlows:
         
         logger.info("✓ Error handling scenarios test completed")
     
-    def test_webhook_delivery_verification(self, driver, login_page, connections_page, webhook_page, test_data):
+    @pytest.mark.integration
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    def test_webhook_delivery_verification(self, logged_in, connections_page, webhook_page, test_data):
         """
         Test comprehensive webhook delivery verification
         """
         logger.info("Starting webhook delivery verification test")
         
         # Setup
-        credentials = config_manager.get_credentials()
-        assert login_page.login(credentials['email'], credentials['password']), "Login failed"
-        
         connections_page.navigate_to_connections()
         data_plane_url = connections_page.get_data_plane_url()
         write_key = connections_page.get_http_source_write_key()
@@ -317,21 +360,20 @@ class TestRudderstackFlows:
         logger.info("✓ Webhook delivery verification test completed")
     
     @pytest.mark.parametrize("event_type", ["page_view", "product_viewed", "add_to_cart", "purchase"])
-    def test_different_event_types(self, driver, login_page, connections_page, webhook_page, test_data, event_type):
+    def test_different_event_types(self, logged_in, setup_connection, webhook_page, test_data, event_type):
         """
         Parameterized test for different event types
         """
         logger.info(f"Testing event type: {event_type}")
         
-        # Setup
-        credentials = config_manager.get_credentials()
-        assert login_page.login(credentials['email'], credentials['password']), "Login failed"
-        
-        connections_page.navigate_to_connections()
-        data_plane_url = connections_page.get_data_plane_url()
-        write_key = connections_page.get_http_source_write_key()
+        # Setup is read once for all event types
+        data_plane_url = setup_connection['data_plane_url']
+        write_key = setup_connection['write_key']
         
-        assert data_plane_url and write_key, "Failed to get required configuration"
+        # Open the webhook events first so earlier deliveries are not counted
+        webhook_page.navigate_to(setup_connection['destination_url'])
+        webhook_page.click_events_tab()
+        baseline = webhook_page.get_event_counts()['delivered']
         
         # Send specific event type
         event_builder = APIFactory.create_event_builder()
@@ -339,22 +381,17 @@ class TestRudderstackFlows:
             .set_event_name(event_type) \
             .set_user_id(f"user_{event_type}") \
             .add_property("event_type", event_type) \
-            .add_property("test_timestamp", int(time.time())) \
+            .add_property("test_timestamp", time.time_ns() // 1_000_000_000) \
             .build()
         
         api_response = api_client.send_event(test_event, write_key, data_plane_url)
         assert api_response['success'], f"Failed to send {event_type} event"
         
-        # Navigate to webhook and verify
-        connections_page.click_webhook_destination()
-        webhook_page.click_events_tab()
-        
         # Wait and verify delivery
-        time.sleep(5)
-        event_counts = webhook_page.get_event_counts()
+        event_counts = wait_for_event_delivered(webhook_page, baseline=baseline)
         
-        # Basic verification - at least one event should be delivered
-        assert event_counts['delivered'] > 0, f"No events delivered for {event_type}"
+        # Basic verification - at least one new event should be delivered
+        assert event_counts['delivered'] > baseline, f"No events delivered for {event_type}"
         
         logger.info(f"✓ {event_type} event test completed successfully")
 
@@ -375,22 +412,3 @@ class TestUtilities:
         logger.info("Cleaning up test data")
         # Implementation would depend on specific cleanup requirements
 
-
-# Pytest hooks for additional functionality
-def pytest_configure(config):
-    """Configure pytest with custom markers"""
-    config.addinivalue_line(
-        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
-    )
-    config.addinivalue_line(
-        "markers", "integration: marks tests as integration tests"
-    )
-
-
-def pytest_collection_modifyitems(config, items):
-    """Modify test collection to add markers"""
-    for item in items:
-        if "test_rudderstack_basic_flow" in item.name:
-            item.add_marker(pytest.mark.integration)
-        if "test_event_tracking_scenario" in item.name:
-            item.add_marker(pytest.mark.slow) 
\ No newline at end of file
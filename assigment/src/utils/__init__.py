@@ -2,10 +2,6 @@
 Utility modules for Rudderstack SDET Assignment Framework
 """
 
-from .config_manager import config_manager
-from .api_client import api_client, APIFactory
-from .test_data import test_data_generator, test_scenario_manager, test_data_validator
-
 __all__ = [
     'config_manager',
     'api_client',
@@ -13,4 +9,29 @@ __all__ = [
     'test_data_generator',
     'test_scenario_manager', 
     'test_data_validator'
-] 
\ No newline at end of file
+]
+
+# Attribute name -> submodule providing it, imported on first access (PEP 562).
+# config_manager and api_client share their submodules' names: once a submodule
+# has been imported directly, the package attribute is that module rather than
+# the singleton, so import those two from their submodules.
+_LAZY_ATTRIBUTES = {
+    'config_manager': '.config_manager',
+    'api_client': '.api_client',
+    'APIFactory': '.api_client',
+    'test_data_generator': '.test_data',
+    'test_scenario_manager': '.test_data',
+    'test_data_validator': '.test_data',
+}
+
+
+def __getattr__(name):
+    """Import utility singletons on first access and cache them on the package"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
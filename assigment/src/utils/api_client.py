@@ -5,7 +5,10 @@ Follows SOLID principles for maintainable and extensible API interactions.
 
 import json
 import time
-from typing import Dict, Any, Optional, List
+from collections import Counter
+from types import MappingProxyType
+from functools import cached_property, lru_cache
+from typing import Dict, Any, Optional, List, Mapping, Callable
 from abc import ABC, abstractmethod
 import requests
 from requests.adapters import HTTPAdapter
@@ -14,12 +17,33 @@ from loguru import logger
 
 from .config_manager import config_manager
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json decodes bytes as well
+    _json_loads = json.loads
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_METHODS = frozenset(("HEAD", "GET", "OPTIONS", "POST"))
+
+
+@lru_cache(maxsize=None)
+def _retry_adapter(total: int, backoff_factor: float) -> HTTPAdapter:
+    """Shared retrying HTTP adapter, built once per distinct retry configuration"""
+    retry_strategy = Retry(
+        total=total,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_METHODS,
+        backoff_factor=backoff_factor
+    )
+    return HTTPAdapter(max_retries=retry_strategy)
+
 
 class APIClientInterface(ABC):
     """Abstract base class for API clients following Interface Segregation Principle"""
     
     @abstractmethod
-    def send_event(self, event_data: Dict[str, Any], write_key: str, data_plane_url: str) -> Dict[str, Any]:
+    def send_event(self, event_data: Mapping[str, Any], write_key: str, data_plane_url: str) -> Dict[str, Any]:
         """Send event to Rudderstack"""
         pass
     
@@ -38,21 +62,18 @@ class RudderstackAPIClient(APIClientInterface):
     def __init__(self):
         """Initialize API client with configuration"""
         self.config = config_manager.api_config
-        self.session = self._create_session()
+    
+    @cached_property
+    def session(self) -> requests.Session:
+        """HTTP session, created on first use"""
+        return self._create_session()
     
     def _create_session(self) -> requests.Session:
         """Create requests session with retry strategy"""
         session = requests.Session()
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.config.retry_attempts,
-            status_forcelist=[429, 500, 502, 503, 504],
-            method_whitelist=["HEAD", "GET", "OPTIONS", "POST"],
-            backoff_factor=self.config.retry_delay
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Reuse the retry strategy and adapter for this configuration
+        adapter = _retry_adapter(self.config.retry_attempts, self.config.retry_delay)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -64,7 +85,7 @@ class RudderstackAPIClient(APIClientInterface):
         
         return session
     
-    def send_event(self, event_data: Dict[str, Any], write_key: str, data_plane_url: str) -> Dict[str, Any]:
+    def send_event(self, event_data: Mapping[str, Any], write_key: str, data_plane_url: str) -> Dict[str, Any]:
         """
         Send event to Rudderstack HTTP API
         
@@ -79,45 +100,113 @@ class RudderstackAPIClient(APIClientInterface):
         try:
             url = f"{data_plane_url}/v1/track"
             
-            payload = {
-                "event": event_data.get("event", "test_event"),
-                "userId": event_data.get("userId", "test_user"),
-                "properties": event_data.get("properties", {}),
-                "context": event_data.get("context", {}),
-                "timestamp": event_data.get("timestamp", int(time.time() * 1000))
-            }
+            payload = self._track_payload(event_data)
             
-            headers = {
-                'Authorization': f'Basic {write_key}',
-                'Content-Type': 'application/json'
-            }
+            # Per-event logs are DEBUG with deferred formatting: no string is
+            # built unless a sink actually accepts DEBUG records
+            logger.debug("Sending event to Rudderstack: {}", payload['event'])
             
-            logger.info(f"Sending event to Rudderstack: {payload['event']}")
+            return self._post(url, payload, write_key)
             
-            response = self.session.post(
-                url,
-                json=payload,
-                headers=headers,
-                timeout=self.config.timeout
-            )
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to send event: {}", e)
+            return self._error_result(e)
+    
+    def send_events_batch(self, events: List[Mapping[str, Any]], write_key: str, data_plane_url: str) -> Dict[str, Any]:
+        """
+        Send several track events to Rudderstack in a single batch request
+        
+        Args:
+            events: Event data to send, in the same shape send_event accepts
+            write_key: HTTP source write key
+            data_plane_url: Data plane URL
             
-            response.raise_for_status()
+        Returns:
+            API response for the whole batch
+        """
+        try:
+            url = f"{data_plane_url}/v1/batch"
             
-            logger.info(f"Event sent successfully. Status: {response.status_code}")
-            return {
-                'success': True,
-                'status_code': response.status_code,
-                'response': response.json() if response.content else {},
-                'event_id': response.headers.get('X-Event-ID')
+            payload = {
+                "batch": [dict(self._track_payload(event_data), type="track") for event_data in events]
             }
             
+            logger.debug("Sending batch of {} events to Rudderstack", len(events))
+            
+            return self._post(url, payload, write_key)
+            
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to send event: {str(e)}")
-            return {
-                'success': False,
-                'error': str(e),
-                'status_code': getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
-            }
+            logger.error("Failed to send event batch: {}", e)
+            return self._error_result(e)
+    
+    @staticmethod
+    def _track_payload(event_data: Mapping[str, Any]) -> Dict[str, Any]:
+        """Build a track payload, filling in defaults for missing fields"""
+        return {
+            "event": event_data.get("event", "test_event"),
+            "userId": event_data.get("userId", "test_user"),
+            "properties": event_data.get("properties", {}),
+            "context": event_data.get("context", {}),
+            "timestamp": event_data.get("timestamp", time.time_ns() // 1_000_000)
+        }
+    
+    def _post(self, url: str, payload: Dict[str, Any], write_key: str) -> Dict[str, Any]:
+        """POST a payload authenticated with the write key; raises on HTTP errors"""
+        headers = {
+            'Authorization': f'Basic {write_key}',
+            'Content-Type': 'application/json'
+        }
+        
+        response = self.session.post(
+            url,
+            json=payload,
+            headers=headers,
+            timeout=self.config.timeout
+        )
+        
+        response.raise_for_status()
+        
+        logger.debug("Event sent successfully. Status: {}", response.status_code)
+        return {
+            'success': True,
+            'status_code': response.status_code,
+            'response': _json_loads(response.content) if response.content else {},
+            'event_id': response.headers.get('X-Event-ID')
+        }
+    
+    @staticmethod
+    def _error_result(e: requests.exceptions.RequestException) -> Dict[str, Any]:
+        """Result dictionary for a failed request"""
+        return {
+            'success': False,
+            'error': str(e),
+            'status_code': getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
+        }
+    
+    def bind(self, write_key: str, data_plane_url: str) -> Callable[[Mapping[str, Any]], requests.Response]:
+        """
+        Bind a write key and data plane URL for tight event-sending loops
+        
+        The track URL, auth header, session and timeout are resolved once, so
+        each call only posts the payload. Payloads are sent as-is (no defaults
+        are filled in) and the raw response is returned without logging.
+        
+        Args:
+            write_key: HTTP source write key
+            data_plane_url: Data plane URL
+            
+        Returns:
+            Callable that posts a track payload and returns the response
+        """
+        url = f"{data_plane_url}/v1/track"
+        headers = {'Authorization': f'Basic {write_key}'}
+        session = self.session
+        timeout = self.config.timeout
+        
+        def track(payload: Mapping[str, Any]) -> requests.Response:
+            return session.post(url, json=payload, headers=headers, timeout=timeout)
+        
+        return track
     
     def get_webhook_events(self, webhook_url: str) -> List[Dict[str, Any]]:
         """
@@ -139,13 +228,13 @@ class RudderstackAPIClient(APIClientInterface):
             
             response.raise_for_status()
             
-            events = response.json() if response.content else []
+            events = _json_loads(response.content) if response.content else []
             logger.info(f"Retrieved {len(events)} webhook events")
             
             return events
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to fetch webhook events: {str(e)}")
+            logger.error("Failed to fetch webhook events: {}", e)
             return []
     
     def get_webhook_stats(self, webhook_url: str) -> Dict[str, int]:
@@ -160,19 +249,12 @@ class RudderstackAPIClient(APIClientInterface):
         """
         events = self.get_webhook_events(webhook_url)
         
-        delivered_count = 0
-        failed_count = 0
-        
-        for event in events:
-            # Check if event was delivered successfully
-            if event.get('status', 200) == 200:
-                delivered_count += 1
-            else:
-                failed_count += 1
+        # Tally delivered (True) vs failed (False) events in one pass
+        outcomes = Counter(event.get('status', 200) == 200 for event in events)
         
         return {
-            'delivered': delivered_count,
-            'failed': failed_count,
+            'delivered': outcomes[True],
+            'failed': outcomes[False],
             'total': len(events)
         }
 
@@ -185,12 +267,17 @@ class EventBuilder:
     
     def __init__(self):
         """Initialize event builder"""
-        self.event_data = {
+        self.event_data = self._new_event_data()
+    
+    @staticmethod
+    def _new_event_data() -> Dict[str, Any]:
+        """Create default event data"""
+        return {
             'event': 'test_event',
             'userId': 'test_user',
             'properties': {},
             'context': {},
-            'timestamp': int(time.time() * 1000)
+            'timestamp': time.time_ns() // 1_000_000
         }
     
     def set_event_name(self, event_name: str) -> 'EventBuilder':
@@ -223,9 +310,28 @@ class EventBuilder:
         self.event_data['timestamp'] = timestamp
         return self
     
-    def build(self) -> Dict[str, Any]:
-        """Build and return event data"""
+    def build(self, consume: bool = False) -> Dict[str, Any]:
+        """
+        Build and return event data
+        
+        Args:
+            consume: Hand over the builder's dict without copying and start
+                the builder afresh. Use when the builder is not reused.
+            
+        Returns:
+            Event data
+        """
+        if consume:
+            event_data, self.event_data = self.event_data, self._new_event_data()
+            return event_data
         return self.event_data.copy()
+    
+    def build_view(self) -> Mapping[str, Any]:
+        """Return a read-only, zero-copy view of the event data for serialization"""
+        return MappingProxyType(self.event_data)
+
+
+_cached_client: Optional[RudderstackAPIClient] = None
 
 
 class APIFactory:
@@ -236,8 +342,11 @@ class APIFactory:
     
     @staticmethod
     def create_rudderstack_client() -> RudderstackAPIClient:
-        """Create Rudderstack API client"""
-        return RudderstackAPIClient()
+        """Get the Rudderstack API client, created once per process"""
+        global _cached_client
+        if _cached_client is None:
+            _cached_client = RudderstackAPIClient()
+        return _cached_client
     
     @staticmethod
     def create_event_builder() -> EventBuilder:
@@ -4,15 +4,33 @@ Follows SOLID principles for maintainable and extensible configuration managemen
 """
 
 import os
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, Mapping, Callable
+from dataclasses import dataclass, asdict, fields, replace, MISSING
 from dotenv import load_dotenv
-from pydantic import BaseSettings, validator
 
 
-@dataclass
-class BrowserConfig:
+class FrozenSlots:
+    """
+    Pickle/copy support for frozen dataclasses with hand-written __slots__
+    (what dataclass(slots=True) generates on Python 3.10+)
+    """
+    __slots__ = ()
+    
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+# Composed configs are read on hot paths, so they use __slots__. The slots are
+# spelled out because dataclass(slots=True) needs Python 3.10+.
+@dataclass(frozen=True)
+class BrowserConfig(FrozenSlots):
     """Browser configuration data class"""
+    __slots__ = ('name', 'version', 'headless', 'window_width', 'window_height', 'timeout', 'implicit_wait', 'page_load_timeout')
+    
     name: str
     version: str
     headless: bool
@@ -23,9 +41,11 @@ class BrowserConfig:
     page_load_timeout: int
 
 
-@dataclass
-class APIConfig:
+@dataclass(frozen=True)
+class APIConfig(FrozenSlots):
     """API configuration data class"""
+    __slots__ = ('base_url', 'timeout', 'retry_attempts', 'max_retries', 'retry_delay')
+    
     base_url: str
     timeout: int
     retry_attempts: int
@@ -33,9 +53,11 @@ class APIConfig:
     retry_delay: int
 
 
-@dataclass
-class TestConfig:
+@dataclass(frozen=True)
+class TestConfig(FrozenSlots):
     """Test configuration data class"""
+    __slots__ = ('parallel_mode', 'max_workers', 'generate_html_report', 'generate_allure_report', 'screenshot_on_failure', 'video_recording')
+    
     parallel_mode: bool
     max_workers: int
     generate_html_report: bool
@@ -44,8 +66,42 @@ class TestConfig:
     video_recording: bool
 
 
-class EnvironmentSettings(BaseSettings):
-    """Environment settings using Pydantic for validation"""
+VALID_ENVIRONMENTS = ('dev', 'qa', 'prod')
+VALID_BROWSERS = ['chrome', 'firefox', 'safari', 'edge']
+VALID_LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+
+_TRUE_VALUES = frozenset({'1', 'true', 'yes', 'on', 'y', 't'})
+_FALSE_VALUES = frozenset({'0', 'false', 'no', 'off', 'n', 'f'})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value"""
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValueError(f"value could not be parsed to a boolean: {value!r}")
+
+
+def _parse_optional(parse: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Wrap a parser so that an empty value is treated as not set"""
+    return lambda value: parse(value) if value.strip() else None
+
+
+# Field type -> parser for the raw environment string
+_ENV_PARSERS: Dict[Any, Callable[[str], Any]] = {
+    str: str,
+    int: int,
+    bool: _parse_bool,
+    Optional[str]: _parse_optional(str),
+    Optional[int]: _parse_optional(int),
+}
+
+
+@dataclass(frozen=True)
+class EnvironmentSettings:
+    """Environment settings read from environment variables (names are case-insensitive)"""
     
     # Rudderstack Credentials
     rudderstack_email: str
@@ -104,33 +160,47 @@ class EnvironmentSettings(BaseSettings):
     email_username: Optional[str] = None
     email_password: Optional[str] = None
     
-    @validator('current_env')
-    def validate_environment(cls, v):
-        """Validate environment value"""
-        if v not in ['dev', 'qa', 'prod']:
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> 'EnvironmentSettings':
+        """
+        Build and validate settings from environment variables
+        
+        Args:
+            environ: Environment mapping (defaults to os.environ)
+            
+        Returns:
+            Validated environment settings
+            
+        Raises:
+            ValueError: If a required setting is missing or a value is invalid
+        """
+        source = os.environ if environ is None else environ
+        raw_values = {key.lower(): value for key, value in source.items()}
+        
+        values: Dict[str, Any] = {}
+        for field in fields(cls):
+            raw = raw_values.get(field.name)
+            if raw is None:
+                if field.default is MISSING:
+                    raise ValueError(f"{field.name.upper()} is required")
+                continue
+            try:
+                values[field.name] = _ENV_PARSERS[field.type](raw)
+            except ValueError as e:
+                raise ValueError(f"Invalid value for {field.name.upper()}: {e}") from e
+        
+        if values.get('current_env', 'dev') not in VALID_ENVIRONMENTS:
             raise ValueError('Environment must be dev, qa, or prod')
-        return v
-    
-    @validator('browser_name')
-    def validate_browser(cls, v):
-        """Validate browser name"""
-        valid_browsers = ['chrome', 'firefox', 'safari', 'edge']
-        if v not in valid_browsers:
-            raise ValueError(f'Browser must be one of: {valid_browsers}')
-        return v
-    
-    @validator('log_level')
-    def validate_log_level(cls, v):
-        """Validate log level"""
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if v.upper() not in valid_levels:
-            raise ValueError(f'Log level must be one of: {valid_levels}')
-        return v.upper()
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+        
+        if values.get('browser_name', 'chrome') not in VALID_BROWSERS:
+            raise ValueError(f'Browser must be one of: {VALID_BROWSERS}')
+        
+        if 'log_level' in values:
+            values['log_level'] = values['log_level'].upper()
+            if values['log_level'] not in VALID_LOG_LEVELS:
+                raise ValueError(f'Log level must be one of: {VALID_LOG_LEVELS}')
+        
+        return cls(**values)
 
 
 class ConfigurationManager:
@@ -151,67 +221,51 @@ class ConfigurationManager:
         else:
             load_dotenv()
         
-        self._settings = EnvironmentSettings()
-        self._browser_config = None
-        self._api_config = None
-        self._test_config = None
+        self._settings = EnvironmentSettings.from_env()
+        self._build_configs()
+    
+    def _build_configs(self) -> None:
+        """Build the composed configs and environment URL map from the current settings in one pass"""
+        settings = self._settings
+        self.browser_config = BrowserConfig(
+            name=settings.browser_name,
+            version=settings.browser_version,
+            headless=settings.headless_mode,
+            window_width=settings.window_width,
+            window_height=settings.window_height,
+            timeout=settings.browser_timeout,
+            implicit_wait=settings.implicit_wait,
+            page_load_timeout=settings.page_load_timeout
+        )
+        self.api_config = APIConfig(
+            base_url=settings.api_base_url,
+            timeout=settings.api_timeout,
+            retry_attempts=settings.api_retry_attempts,
+            max_retries=settings.max_retries,
+            retry_delay=settings.retry_delay
+        )
+        self.test_config = TestConfig(
+            parallel_mode=settings.parallel_mode,
+            max_workers=settings.max_workers,
+            generate_html_report=settings.generate_html_report,
+            generate_allure_report=settings.generate_allure_report,
+            screenshot_on_failure=settings.screenshot_on_failure,
+            video_recording=settings.video_recording
+        )
+        self._env_urls = {
+            'dev': settings.dev_url,
+            'qa': settings.qa_url,
+            'prod': settings.prod_url
+        }
     
     @property
     def settings(self) -> EnvironmentSettings:
         """Get environment settings"""
         return self._settings
     
-    @property
-    def browser_config(self) -> BrowserConfig:
-        """Get browser configuration"""
-        if not self._browser_config:
-            self._browser_config = BrowserConfig(
-                name=self._settings.browser_name,
-                version=self._settings.browser_version,
-                headless=self._settings.headless_mode,
-                window_width=self._settings.window_width,
-                window_height=self._settings.window_height,
-                timeout=self._settings.browser_timeout,
-                implicit_wait=self._settings.implicit_wait,
-                page_load_timeout=self._settings.page_load_timeout
-            )
-        return self._browser_config
-    
-    @property
-    def api_config(self) -> APIConfig:
-        """Get API configuration"""
-        if not self._api_config:
-            self._api_config = APIConfig(
-                base_url=self._settings.api_base_url,
-                timeout=self._settings.api_timeout,
-                retry_attempts=self._settings.api_retry_attempts,
-                max_retries=self._settings.max_retries,
-                retry_delay=self._settings.retry_delay
-            )
-        return self._api_config
-    
-    @property
-    def test_config(self) -> TestConfig:
-        """Get test configuration"""
-        if not self._test_config:
-            self._test_config = TestConfig(
-                parallel_mode=self._settings.parallel_mode,
-                max_workers=self._settings.max_workers,
-                generate_html_report=self._settings.generate_html_report,
-                generate_allure_report=self._settings.generate_allure_report,
-                screenshot_on_failure=self._settings.screenshot_on_failure,
-                video_recording=self._settings.video_recording
-            )
-        return self._test_config
-    
     def get_environment_url(self) -> str:
         """Get current environment URL"""
-        env_mapping = {
-            'dev': self._settings.dev_url,
-            'qa': self._settings.qa_url,
-            'prod': self._settings.prod_url
-        }
-        return env_mapping.get(self._settings.current_env, self._settings.dev_url)
+        return self._env_urls.get(self._settings.current_env, self._settings.dev_url)
     
     def get_credentials(self) -> Dict[str, str]:
         """Get Rudderstack credentials"""
@@ -233,9 +287,9 @@ class ConfigurationManager:
         return {
             'environment': self._settings.current_env,
             'base_url': self.get_environment_url(),
-            'browser': self.browser_config.__dict__,
-            'api': self.api_config.__dict__,
-            'test': self.test_config.__dict__,
+            'browser': asdict(self.browser_config),
+            'api': asdict(self.api_config),
+            'test': asdict(self.test_config),
             'credentials': {
                 'email': self._settings.rudderstack_email,
                 'password': '***'  # Mask password for security
@@ -252,33 +306,24 @@ class ConfigurationManager:
     ) -> None:
         """
         Apply runtime overrides from CLI args (pytest options).
-        This updates the underlying settings and clears cached configs.
+        This replaces the underlying settings and rebuilds the composed configs.
         """
-        updated = False
+        updates: Dict[str, Any] = {}
         if current_env:
-            self._settings.current_env = current_env
-            updated = True
+            updates['current_env'] = current_env
         if email:
-            self._settings.rudderstack_email = email
-            updated = True
+            updates['rudderstack_email'] = email
         if password:
-            self._settings.rudderstack_password = password
-            updated = True
+            updates['rudderstack_password'] = password
         if base_url:
             # Apply base URL to the selected environment if provided
             env_key = (current_env or self._settings.current_env or 'dev').lower()
-            if env_key == 'dev':
-                self._settings.dev_url = base_url
-            elif env_key == 'qa':
-                self._settings.qa_url = base_url
-            elif env_key == 'prod':
-                self._settings.prod_url = base_url
-            updated = True
-        # Clear cached composed configs so subsequent accesses reflect overrides
-        if updated:
-            self._browser_config = None
-            self._api_config = None
-            self._test_config = None
+            if env_key in ('dev', 'qa', 'prod'):
+                updates[f'{env_key}_url'] = base_url
+        # Swap in an updated copy and rebuild composed configs so subsequent accesses reflect overrides
+        if updates:
+            self._settings = replace(self._settings, **updates)
+            self._build_configs()
 
 
 # Global configuration instance
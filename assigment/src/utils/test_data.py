@@ -4,28 +4,93 @@ Follows SOLID principles for maintainable and extensible test data management.
 """
 
 import json
+import os
 import random
 import string
-from typing import Dict, Any, List, Optional
+import time
+import uuid
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
-from faker import Faker
 
-from .config_manager import config_manager
+from .config_manager import config_manager, FrozenSlots
 
+_VALID_SOURCE_TYPES = frozenset({'HTTP', 'Webhook', 'SDK'})
+_VALID_DESTINATION_TYPES = frozenset({'Webhook', 'HTTP'})
+_WRITE_KEY_ALPHABET = string.ascii_letters + string.digits
 
-@dataclass
-class TestUser:
+# Predefined test scenarios, shared read-only by every TestScenarioManager
+_SCENARIOS = MappingProxyType({
+    'basic_flow': {
+        'name': 'Basic Rudderstack Flow',
+        'description': 'Complete flow from login to event verification',
+        'steps': [
+            'login_to_rudderstack',
+            'navigate_to_connections',
+            'extract_data_plane_url',
+            'extract_write_key',
+            'send_test_event',
+            'verify_webhook_delivery'
+        ],
+        'expected_results': {
+            'login_successful': True,
+            'data_plane_url_extracted': True,
+            'write_key_extracted': True,
+            'event_sent_successfully': True,
+            'webhook_delivery_verified': True
+        }
+    },
+    'event_tracking': {
+        'name': 'Event Tracking Test',
+        'description': 'Test various event types and properties',
+        'steps': [
+            'setup_test_environment',
+            'send_multiple_events',
+            'verify_event_delivery',
+            'check_event_properties'
+        ],
+        'expected_results': {
+            'all_events_sent': True,
+            'events_delivered_correctly': True,
+            'properties_preserved': True
+        }
+    },
+    'error_handling': {
+        'name': 'Error Handling Test',
+        'description': 'Test error scenarios and edge cases',
+        'steps': [
+            'test_invalid_credentials',
+            'test_invalid_write_key',
+            'test_network_timeout',
+            'test_malformed_event'
+        ],
+        'expected_results': {
+            'errors_handled_gracefully': True,
+            'appropriate_error_messages': True,
+            'no_system_crashes': True
+        }
+    }
+})
+
+
+# Test payloads are immutable and slotted like the config dataclasses; slots are
+# spelled out because dataclass(slots=True) needs Python 3.10+
+@dataclass(frozen=True)
+class TestUser(FrozenSlots):
     """Test user data class"""
+    __slots__ = ('email', 'password', 'name', 'company')
+    
     email: str
     password: str
     name: str
     company: str
 
 
-@dataclass
-class TestEvent:
+@dataclass(frozen=True)
+class TestEvent(FrozenSlots):
     """Test event data class"""
+    __slots__ = ('event_name', 'user_id', 'properties', 'context', 'timestamp')
+    
     event_name: str
     user_id: str
     properties: Dict[str, Any]
@@ -33,18 +98,22 @@ class TestEvent:
     timestamp: int
 
 
-@dataclass
-class TestSource:
+@dataclass(frozen=True)
+class TestSource(FrozenSlots):
     """Test source data class"""
+    __slots__ = ('name', 'type', 'write_key', 'data_plane_url')
+    
     name: str
     type: str
     write_key: str
     data_plane_url: str
 
 
-@dataclass
-class TestDestination:
+@dataclass(frozen=True)
+class TestDestination(FrozenSlots):
     """Test destination data class"""
+    __slots__ = ('name', 'type', 'webhook_url', 'config')
+    
     name: str
     type: str
     webhook_url: str
@@ -57,10 +126,35 @@ class TestDataGenerator:
     Generates various types of test data
     """
     
+    # Values generated per Faker provider; later draws sample from this pool
+    POOL_SIZE = 64
+    
     def __init__(self):
         """Initialize test data generator"""
+        # Faker is slow to import, so only pay for it once a generator is built
+        from faker import Faker
+        
         self.fake = Faker()
         self.fake.seed_instance(42)  # For reproducible data
+        # Private generator, so draws don't touch (or depend on) the global random state
+        self._rng = random.Random(42)
+        self._pools: Dict[str, List[Any]] = {}
+    
+    def _pick(self, provider: str) -> Any:
+        """
+        Draw a value from a Faker provider's pool, generating the pool on first use
+        
+        Args:
+            provider: Faker provider name, e.g. 'user_agent'
+            
+        Returns:
+            A value generated by that provider
+        """
+        pool = self._pools.get(provider)
+        if pool is None:
+            generate = getattr(self.fake, provider)
+            pool = self._pools[provider] = [generate() for _ in range(self.POOL_SIZE)]
+        return self._rng.choice(pool)
     
     def generate_user(self, **kwargs) -> TestUser:
         """Generate test user data"""
@@ -68,23 +162,23 @@ class TestDataGenerator:
             email=kwargs.get('email', self.fake.company_email()),
             password=kwargs.get('password', self.fake.password()),
             name=kwargs.get('name', self.fake.name()),
-            company=kwargs.get('company', self.fake.company())
+            company=kwargs.get('company', self._pick('company'))
         )
     
     def generate_event(self, **kwargs) -> TestEvent:
         """Generate test event data"""
         return TestEvent(
             event_name=kwargs.get('event_name', 'test_event'),
-            user_id=kwargs.get('user_id', self.fake.uuid4()),
-            properties=kwargs.get('properties', self._generate_properties()),
+            user_id=kwargs.get('user_id', self._generate_user_id()),
+            properties=kwargs.get('properties', self.generate_properties()),
             context=kwargs.get('context', self._generate_context()),
-            timestamp=kwargs.get('timestamp', int(datetime.now().timestamp() * 1000))
+            timestamp=kwargs.get('timestamp', time.time_ns() // 1_000_000)
         )
     
     def generate_source(self, **kwargs) -> TestSource:
         """Generate test source data"""
         return TestSource(
-            name=kwargs.get('name', f"Test HTTP Source {self.fake.word()}"),
+            name=kwargs.get('name', f"Test HTTP Source {self._pick('word')}"),
             type=kwargs.get('type', 'HTTP'),
             write_key=kwargs.get('write_key', self._generate_write_key()),
             data_plane_url=kwargs.get('data_plane_url', config_manager.get_environment_url())
@@ -93,54 +187,59 @@ class TestDataGenerator:
     def generate_destination(self, **kwargs) -> TestDestination:
         """Generate test destination data"""
         return TestDestination(
-            name=kwargs.get('name', f"Test Webhook Destination {self.fake.word()}"),
+            name=kwargs.get('name', f"Test Webhook Destination {self._pick('word')}"),
             type=kwargs.get('type', 'Webhook'),
             webhook_url=kwargs.get('webhook_url', config_manager.get_webhook_url()),
             config=kwargs.get('config', self._generate_webhook_config())
         )
     
-    def _generate_properties(self) -> Dict[str, Any]:
-        """Generate random event properties"""
+    def generate_properties(self) -> Dict[str, Any]:
+        """Generate random event properties, without building a whole event"""
         return {
-            'product_id': self.fake.uuid4(),
-            'product_name': self.fake.product_name(),
-            'price': round(random.uniform(10.0, 1000.0), 2),
-            'quantity': random.randint(1, 10),
-            'category': self.fake.word(),
-            'brand': self.fake.company(),
-            'color': self.fake.color_name(),
-            'size': random.choice(['S', 'M', 'L', 'XL']),
+            'product_id': str(uuid.uuid4()),
+            'product_name': self._pick('product_name'),
+            'price': round(self._rng.uniform(10.0, 1000.0), 2),
+            'quantity': self._rng.randint(1, 10),
+            'category': self._pick('word'),
+            'brand': self._pick('company'),
+            'color': self._pick('color_name'),
+            'size': self._rng.choice(['S', 'M', 'L', 'XL']),
             'currency': 'USD',
-            'discount': round(random.uniform(0.0, 0.5), 2)
+            'discount': round(self._rng.uniform(0.0, 0.5), 2)
         }
     
+    def _generate_user_id(self) -> str:
+        """Generate a user ID that is unique across pytest-xdist workers"""
+        # The worker ID also shows which worker sent an event
+        return f"{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}-{uuid.uuid4()}"
+    
     def _generate_context(self) -> Dict[str, Any]:
         """Generate random event context"""
         return {
             'page': {
-                'url': self.fake.url(),
-                'title': self.fake.sentence(),
-                'referrer': self.fake.url()
+                'url': self._pick('url'),
+                'title': self._pick('sentence'),
+                'referrer': self._pick('url')
             },
-            'user_agent': self.fake.user_agent(),
-            'ip': self.fake.ipv4(),
-            'locale': self.fake.locale(),
-            'timezone': self.fake.timezone(),
+            'user_agent': self._pick('user_agent'),
+            'ip': self._pick('ipv4'),
+            'locale': self._pick('locale'),
+            'timezone': self._pick('timezone'),
             'screen': {
-                'width': random.randint(800, 2560),
-                'height': random.randint(600, 1440)
+                'width': self._rng.randint(800, 2560),
+                'height': self._rng.randint(600, 1440)
             },
             'campaign': {
-                'name': self.fake.word(),
-                'source': self.fake.word(),
-                'medium': self.fake.word(),
-                'term': self.fake.word()
+                'name': self._pick('word'),
+                'source': self._pick('word'),
+                'medium': self._pick('word'),
+                'term': self._pick('word')
             }
         }
     
     def _generate_write_key(self) -> str:
         """Generate random write key"""
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=32))
+        return ''.join(self._rng.choices(_WRITE_KEY_ALPHABET, k=32))
     
     def _generate_webhook_config(self) -> Dict[str, Any]:
         """Generate webhook configuration"""
@@ -167,67 +266,17 @@ class TestScenarioManager:
         self.data_generator = TestDataGenerator()
         self.scenarios = self._load_scenarios()
     
-    def _load_scenarios(self) -> Dict[str, Dict[str, Any]]:
+    def _load_scenarios(self) -> Mapping[str, Dict[str, Any]]:
         """Load predefined test scenarios"""
-        return {
-            'basic_flow': {
-                'name': 'Basic Rudderstack Flow',
-                'description': 'Complete flow from login to event verification',
-                'steps': [
-                    'login_to_rudderstack',
-                    'navigate_to_connections',
-                    'extract_data_plane_url',
-                    'extract_write_key',
-                    'send_test_event',
-                    'verify_webhook_delivery'
-                ],
-                'expected_results': {
-                    'login_successful': True,
-                    'data_plane_url_extracted': True,
-                    'write_key_extracted': True,
-                    'event_sent_successfully': True,
-                    'webhook_delivery_verified': True
-                }
-            },
-            'event_tracking': {
-                'name': 'Event Tracking Test',
-                'description': 'Test various event types and properties',
-                'steps': [
-                    'setup_test_environment',
-                    'send_multiple_events',
-                    'verify_event_delivery',
-                    'check_event_properties'
-                ],
-                'expected_results': {
-                    'all_events_sent': True,
-                    'events_delivered_correctly': True,
-                    'properties_preserved': True
-                }
-            },
-            'error_handling': {
-                'name': 'Error Handling Test',
-                'description': 'Test error scenarios and edge cases',
-                'steps': [
-                    'test_invalid_credentials',
-                    'test_invalid_write_key',
-                    'test_network_timeout',
-                    'test_malformed_event'
-                ],
-                'expected_results': {
-                    'errors_handled_gracefully': True,
-                    'appropriate_error_messages': True,
-                    'no_system_crashes': True
-                }
-            }
-        }
+        return _SCENARIOS
     
     def get_scenario(self, scenario_name: str) -> Optional[Dict[str, Any]]:
         """Get test scenario by name"""
         return self.scenarios.get(scenario_name)
     
-    def get_all_scenarios(self) -> Dict[str, Dict[str, Any]]:
-        """Get all available test scenarios"""
-        return self.scenarios.copy()
+    def get_all_scenarios(self) -> Mapping[str, Dict[str, Any]]:
+        """Get all available test scenarios as a read-only view"""
+        return self.scenarios
     
     def create_test_data_for_scenario(self, scenario_name: str) -> Dict[str, Any]:
         """Create test data for specific scenario"""
@@ -258,68 +307,67 @@ class TestDataValidator:
     @staticmethod
     def validate_user(user: TestUser) -> bool:
         """Validate test user data"""
-        return all([
-            user.email and '@' in user.email,
-            user.password and len(user.password) >= 8,
-            user.name and len(user.name) > 0,
-            user.company and len(user.company) > 0
-        ])
+        return bool(
+            user.email and '@' in user.email
+            and user.password and len(user.password) >= 8
+            and user.name
+            and user.company
+        )
     
     @staticmethod
     def validate_event(event: TestEvent) -> bool:
         """Validate test event data"""
-        return all([
-            event.event_name and len(event.event_name) > 0,
-            event.user_id and len(event.user_id) > 0,
-            isinstance(event.properties, dict),
-            isinstance(event.context, dict),
-            event.timestamp > 0
-        ])
+        return bool(
+            event.event_name
+            and event.user_id
+            and isinstance(event.properties, dict)
+            and isinstance(event.context, dict)
+            and event.timestamp > 0
+        )
     
     @staticmethod
     def validate_source(source: TestSource) -> bool:
         """Validate test source data"""
-        return all([
-            source.name and len(source.name) > 0,
-            source.type in ['HTTP', 'Webhook', 'SDK'],
-            source.write_key and len(source.write_key) > 0,
-            source.data_plane_url and source.data_plane_url.startswith('http')
-        ])
+        return bool(
+            source.name
+            and source.type in _VALID_SOURCE_TYPES
+            and source.write_key
+            and source.data_plane_url and source.data_plane_url.startswith('http')
+        )
     
     @staticmethod
     def validate_destination(destination: TestDestination) -> bool:
         """Validate test destination data"""
-        return all([
-            destination.name and len(destination.name) > 0,
-            destination.type in ['Webhook', 'HTTP'],
-            destination.webhook_url and destination.webhook_url.startswith('http'),
-            isinstance(destination.config, dict)
-        ])
+        return bool(
+            destination.name
+            and destination.type in _VALID_DESTINATION_TYPES
+            and destination.webhook_url and destination.webhook_url.startswith('http')
+            and isinstance(destination.config, dict)
+        )
     
     @staticmethod
     def validate_api_response(response: Dict[str, Any]) -> bool:
         """Validate API response"""
-        return all([
-            isinstance(response, dict),
-            'success' in response,
-            response.get('success') is True,
-            'status_code' in response,
-            response.get('status_code') == 200
-        ])
+        return (
+            isinstance(response, dict)
+            and response.get('success') is True
+            and response.get('status_code') == 200
+        )
     
     @staticmethod
     def validate_webhook_stats(stats: Dict[str, int]) -> bool:
         """Validate webhook statistics"""
-        return all([
-            isinstance(stats, dict),
-            'delivered' in stats,
-            'failed' in stats,
-            'total' in stats,
-            isinstance(stats['delivered'], int),
-            isinstance(stats['failed'], int),
-            isinstance(stats['total'], int),
-            stats['total'] == stats['delivered'] + stats['failed']
-        ])
+        # Conditions short-circuit, so a missing key fails validation instead of raising
+        return (
+            isinstance(stats, dict)
+            and 'delivered' in stats
+            and 'failed' in stats
+            and 'total' in stats
+            and isinstance(stats['delivered'], int)
+            and isinstance(stats['failed'], int)
+            and isinstance(stats['total'], int)
+            and stats['total'] == stats['delivered'] + stats['failed']
+        )
 
 
 class TestDataFactory:
@@ -344,7 +392,21 @@ class TestDataFactory:
         return TestDataValidator()
 
 
-# Global test data instances
-test_data_generator = TestDataFactory.create_data_generator()
-test_scenario_manager = TestDataFactory.create_scenario_manager()
-test_data_validator = TestDataFactory.create_validator() 
\ No newline at end of file
+# Global test data instances; the generator and scenario manager (and Faker with
+# them) are loaded on first access, so importing just the validator stays cheap
+test_data_validator = TestDataFactory.create_validator()
+
+_LAZY_GLOBALS = {
+    'test_data_generator': TestDataFactory.create_data_generator,
+    'test_scenario_manager': TestDataFactory.create_scenario_manager,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Create a lazy global on first access and keep it as a regular module attribute"""
+    factory = _LAZY_GLOBALS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = globals()[name] = factory()
+    return value 
\ No newline at end of file